@@ -1,5 +1,6 @@
 """Mobility agents package."""
 
-from agents.mobility.base import BaseMobilityAgent
+from agents.mobility.base import BaseMobilityAgent, token_usage
+from agents.mobility.errors import AgentError, AgentResult, ErrorCode
 
-__all__ = ["BaseMobilityAgent"]
+__all__ = ["BaseMobilityAgent", "token_usage", "AgentError", "AgentResult", "ErrorCode"]
@@ -2,12 +2,35 @@
 All remaining mobility agents (4-19).
 
 This file contains the remaining 16 specialized agents to keep implementation efficient.
-Each agent follows the same pattern as the first 3 agents.
+Each agent follows the same pattern as the first 3 agents. Node functions are
+async so LangGraph can await all independent agents concurrently.
 """
 
+import asyncio
+
 from agents.mobility.base import BaseMobilityAgent
-from schemas.mobility_measure import MobilityResearchState
-from config.llm import groq_llm, anthropic_llm
+from schemas.mobility_measure import MobilityResearchState, MobilityBatchState
+from schemas.prompts import PROMPTS
+
+# Star-imports expose only the graph node functions
+__all__ = [
+    "evidence_agent_node",
+    "impact_agent_node",
+    "requirements_agent_node",
+    "infrastructure_agent_node",
+    "operations_agent_node",
+    "costs_agent_node",
+    "risks_agent_node",
+    "monitoring_agent_node",
+    "checklist_agent_node",
+    "lifecycle_agent_node",
+    "roles_agent_node",
+    "financial_agent_node",
+    "compliance_agent_node",
+    "visibility_agent_node",
+    "selection_agent_node",
+    "scalability_agent_node",
+]
 
 
 # ============================================================================
@@ -15,34 +38,10 @@ from config.llm import groq_llm, anthropic_llm
 # ============================================================================
 
 class EvidenceAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY the "evidence" section:
-
-{
-  "sweden": [],
-  "europe": [],
-  "research": [],
-  "behavioural": []
-}
-
-Provide descriptive, research-aligned insights.
-Each bullet must convey an actual finding or pattern.
-Avoid clichés like "this increases sustainability".
-Base statements on known mobility principles (secure parking improves cycling rates, proximity increases mode choice likelihood, etc.)
-
-Rules:
-- Each item should be a meaningful insight, not a generic claim
-- Reference real mobility patterns and principles
-- 1–3 substantive points per field'''
+    SCHEMA_PROMPT = PROMPTS["evidence"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("evidence", self.SCHEMA_PROMPT, llm_instance)
-
-
-def evidence_agent_node(state: MobilityResearchState) -> dict:
-    # Evidence: Groq (Data/Facts)
-    agent = EvidenceAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"evidence": result, "errors": [error]} if error else {"evidence": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("evidence", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -50,35 +49,10 @@ def evidence_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class ImpactAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "car_ownership_reduction": "",
-  "modal_shift": "",
-  "parking_reduction": "",
-  "satisfaction": "",
-  "congestion_reduction": "",
-  "long_distance_support": "",
-  "other": ""
-}
-
-Describe expected impacts in meaningful qualitative ranges.
-Avoid single words like "high" unless paired with detail (e.g., "high, especially in dense districts where cycling is common").
-
-Rules:
-- Provide context and reasoning for each impact level
-- Use qualitative ranges with explanation when possible
-- Connect impacts to specific conditions or user groups'''
+    SCHEMA_PROMPT = PROMPTS["impact"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("impact", self.SCHEMA_PROMPT, llm_instance)
-
-
-def impact_agent_node(state: MobilityResearchState) -> dict:
-    # Impact: Anthropic (Nuance/Reasoning)
-    agent = ImpactAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"impact": result, "errors": [error]} if error else {"impact": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("impact", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -86,35 +60,10 @@ def impact_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class RequirementsAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "security": [],
-  "infrastructure": [],
-  "charging": [],
-  "accessibility": [],
-  "information": [],
-  "quality_standards": []
-}
-
-Each requirement must be descriptive and concrete.
-Avoid terms like "secure bike parking" alone.
-Instead describe what security means (locking points, CCTV, lighting, enclosure quality).
-
-Rules:
-- Explain WHAT each requirement consists of
-- Describe WHY it matters for implementation
-- Provide specific, actionable detail'''
+    SCHEMA_PROMPT = PROMPTS["requirements"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("requirements", self.SCHEMA_PROMPT, llm_instance)
-
-
-def requirements_agent_node(state: MobilityResearchState) -> dict:
-    # Requirements: Groq (Structural)
-    agent = RequirementsAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"requirements": result, "errors": [error]} if error else {"requirements": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("requirements", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -122,33 +71,10 @@ def requirements_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class InfrastructureAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "key_requirements": [],
-  "power_requirements": [],
-  "weather_protection": [],
-  "placement_rules": [],
-  "notes": ""
-}
-
-For each item, describe physical characteristics, spatial standards, dimensions, environmental considerations, and user experience.
-Avoid simple nouns; provide meaningful explanation.
-
-Rules:
-- Describe WHAT the infrastructure consists of physically
-- Include relevant dimensions, materials, or technical specs when applicable
-- Explain HOW placement or design affects functionality'''
+    SCHEMA_PROMPT = PROMPTS["infrastructure"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("infrastructure", self.SCHEMA_PROMPT, llm_instance)
-
-
-def infrastructure_agent_node(state: MobilityResearchState) -> dict:
-    # Infrastructure: Groq (Technical)
-    agent = InfrastructureAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"infrastructure": result, "errors": [error]} if error else {"infrastructure": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("infrastructure", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -156,40 +82,10 @@ def infrastructure_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class OperationsAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "developer": [],
-  "housing_association": [],
-  "mobility_provider": [],
-  "city": [],
-  "operations_phases": {
-    "installation": [],
-    "maintenance": [],
-    "data_reporting": [],
-    "upgrades": []
-  }
-}
-
-Instead of listing actors, describe their operational role in a meaningful way:
-- What the developer maintains during construction
-- What housing associations oversee day-to-day
-- What mobility providers are responsible for regarding service reliability
-
-Rules:
-- Describe WHAT each actor actually does operationally
-- Explain responsibilities with context
-- For phases, describe activities with operational or planning detail'''
+    SCHEMA_PROMPT = PROMPTS["operations"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("operations", self.SCHEMA_PROMPT, llm_instance)
-
-
-def operations_agent_node(state: MobilityResearchState) -> dict:
-    # Operations: Groq (Process/Steps)
-    agent = OperationsAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"operations": result, "errors": [error]} if error else {"operations": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("operations", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -197,31 +93,10 @@ def operations_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class CostsAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "upfront": "",
-  "operational": "",
-  "benefits": []
-}
-
-Provide qualitative ranges AND explanation.
-Example: "Upfront cost: medium — typically involves shelter installation, structural anchoring, and durable fixtures."
-
-Rules:
-- Use qualitative levels (low/medium/high) with reasoning
-- Explain WHAT drives costs
-- Describe benefits with specific detail'''
+    SCHEMA_PROMPT = PROMPTS["costs"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("costs", self.SCHEMA_PROMPT, llm_instance)
-
-
-def costs_agent_node(state: MobilityResearchState) -> dict:
-    # Costs: Groq (Estimates)
-    agent = CostsAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"costs": result, "errors": [error]} if error else {"costs": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("costs", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -229,32 +104,10 @@ def costs_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class RisksAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "risk_1": "",
-  "risk_2": "",
-  "risk_3": ""
-}
-
-Each risk must describe WHY the risk occurs and HOW it affects implementation or adoption.
-Avoid generic phrasing.
-
-Rules:
-- Explain the risk mechanism, not just naming it
-- Describe impact on implementation or user adoption
-- Provide context on likelihood or severity
-- Maximum 3 most significant risks'''
+    SCHEMA_PROMPT = PROMPTS["risks"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("risks", self.SCHEMA_PROMPT, llm_instance)
-
-
-def risks_agent_node(state: MobilityResearchState) -> dict:
-    # Risks: Anthropic (Critical Thinking)
-    agent = RisksAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"risks": result, "errors": [error]} if error else {"risks": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("risks", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -262,30 +115,10 @@ def risks_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class MonitoringAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "metrics": [],
-  "frequency": ""
-}
-
-Metrics must be measurable and meaningful.
-Describe what each metric actually captures.
-
-Rules:
-- 3–6 specific, measurable metrics
-- Explain WHAT each metric measures and WHY it matters
-- Frequency should include reasoning (e.g., "Quarterly to capture seasonal patterns")'''
+    SCHEMA_PROMPT = PROMPTS["monitoring"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("monitoring", self.SCHEMA_PROMPT, llm_instance)
-
-
-def monitoring_agent_node(state: MobilityResearchState) -> dict:
-    # Monitoring: Groq (Metrics)
-    agent = MonitoringAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"monitoring": result, "errors": [error]} if error else {"monitoring": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("monitoring", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -293,32 +126,10 @@ def monitoring_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class ChecklistAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "before_move_in": [],
-  "at_move_in": [],
-  "after_move_in": []
-}
-
-Checklists must describe the intention behind each step.
-For example: "Assess evening visibility to ensure safe access during winter months."
-
-Rules:
-- Each item = 3–6 steps per phase
-- Describe WHAT to verify/do and WHY it matters
-- Provide actionable detail, not generic tasks
-- Include context on timing, conditions, or stakeholders involved'''
+    SCHEMA_PROMPT = PROMPTS["checklist"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("checklist", self.SCHEMA_PROMPT, llm_instance)
-
-
-def checklist_agent_node(state: MobilityResearchState) -> dict:
-    # Checklist: Groq (Procedural)
-    agent = ChecklistAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"checklist": result, "errors": [error]} if error else {"checklist": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("checklist", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -326,36 +137,10 @@ def checklist_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class LifecycleAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "stage_1_land_allocation": [],
-  "stage_2_detailed_planning": [],
-  "stage_3_construction": [],
-  "stage_4_pre_occupancy": [],
-  "stage_5_operation_year_1": [],
-  "stage_6_long_term": []
-}
-
-Each lifecycle item must describe activities with operational or planning detail.
-Avoid listing 'design' or 'choose'.
-Include considerations, dependencies, or planning context.
-
-Rules:
-- 2–5 items per stage
-- Describe WHAT happens and WHY it's important at this stage
-- Include dependencies, stakeholder coordination, or critical decisions
-- Provide planning context, not just action verbs'''
+    SCHEMA_PROMPT = PROMPTS["lifecycle"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("lifecycle", self.SCHEMA_PROMPT, llm_instance)
-
-
-def lifecycle_agent_node(state: MobilityResearchState) -> dict:
-    # Lifecycle: Groq (Sequential)
-    agent = LifecycleAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"lifecycle": result, "errors": [error]} if error else {"lifecycle": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("lifecycle", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -363,47 +148,10 @@ def lifecycle_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class RolesAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "developer": {
-    "financial": [],
-    "technical": [],
-    "handover": []
-  },
-  "housing_association": {
-    "financial": [],
-    "operation": [],
-    "issue_resolution": []
-  },
-  "mobility_provider": {
-    "service_level": [],
-    "data": [],
-    "support": []
-  },
-  "city": {
-    "regulation": [],
-    "monitoring": []
-  }
-}
-
-Each responsibility must state what the actor actually DOES and WHY their role matters.
-Avoid simple labels like "maintenance".
-
-Rules:
-- Describe concrete responsibilities with context
-- Explain HOW each role contributes to measure success
-- Provide operational detail on what tasks involve'''
+    SCHEMA_PROMPT = PROMPTS["roles"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("roles", self.SCHEMA_PROMPT, llm_instance)
-
-
-def roles_agent_node(state: MobilityResearchState) -> dict:
-    # Roles: Anthropic (Complex Interactions)
-    agent = RolesAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"roles_responsibilities_detailed": result, "errors": [error]} if error else {"roles_responsibilities_detailed": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("roles", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -411,45 +159,10 @@ def roles_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class FinancialAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "cost_distribution": {
-    "developer": [],
-    "mobility_provider": [],
-    "housing_association": [],
-    "city": []
-  },
-  "estimated_costs": {
-    "installation_cost": "",
-    "annual_maintenance": "",
-    "electricity_cost": ""
-  },
-  "savings": {
-    "parking_construction_reduction": "",
-    "reduced_need_for_family_car_ownership": ""
-  },
-  "incentives": []
-}
-
-Costs and savings must include reasoning and context.
-Avoid generic terms without explanation.
-
-Rules:
-- Use qualitative/semi-quantitative values with explanation
-- Describe WHAT drives each cost component
-- Explain HOW savings materialize
-- incentives: 1–3 items with specific detail on requirements or mechanisms'''
+    SCHEMA_PROMPT = PROMPTS["financial"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("financial", self.SCHEMA_PROMPT, llm_instance)
-
-
-def financial_agent_node(state: MobilityResearchState) -> dict:
-    # Financial: Anthropic (Reasoning)
-    agent = FinancialAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"financial_model": result, "errors": [error]} if error else {"financial_model": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("financial", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -457,33 +170,10 @@ def financial_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class ComplianceAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "minimum_requirements": [],
-  "documentation_required": [],
-  "approval_process": [],
-  "non_compliance_actions": []
-}
-
-Explain compliance expectations clearly.
-Documentation items should describe what they validate.
-
-Rules:
-- Describe WHAT each requirement ensures
-- Explain WHY documentation is needed
-- Detail approval steps with stakeholders involved
-- Describe consequences and remediation for non-compliance'''
+    SCHEMA_PROMPT = PROMPTS["compliance"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("compliance", self.SCHEMA_PROMPT, llm_instance)
-
-
-def compliance_agent_node(state: MobilityResearchState) -> dict:
-    # Compliance: Anthropic (Regulations)
-    agent = ComplianceAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"compliance": result, "errors": [error]} if error else {"compliance": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("compliance", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -491,30 +181,10 @@ def compliance_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class VisibilityAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "signage": [],
-  "digital": [],
-  "physical_touchpoints": []
-}
-
-Describe what signage or communication elements actually convey and how they support adoption.
-
-Rules:
-- Explain WHAT information each element communicates
-- Describe WHERE and WHEN users encounter it
-- Explain HOW it supports awareness or usage'''
+    SCHEMA_PROMPT = PROMPTS["visibility"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("visibility", self.SCHEMA_PROMPT, llm_instance)
-
-
-def visibility_agent_node(state: MobilityResearchState) -> dict:
-    # Visibility: Groq (Visual/Design)
-    agent = VisibilityAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"visibility_and_communication_design": result, "errors": [error]} if error else {"visibility_and_communication_design": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("visibility", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -522,31 +192,10 @@ def visibility_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class SelectionAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "requires": [],
-  "not_recommended_if": [],
-  "recommended_combination": []
-}
-
-Provide meaningful context for suitability decisions.
-Avoid simple yes/no phrases.
-
-Rules:
-- Describe prerequisites with reasoning
-- Explain WHY certain conditions make this unsuitable
-- Suggest combinations that enhance effectiveness with explanation'''
+    SCHEMA_PROMPT = PROMPTS["selection"]
     
-    def __init__(self, llm_instance=None):
-        super().__init__("selection", self.SCHEMA_PROMPT, llm_instance)
-
-
-def selection_agent_node(state: MobilityResearchState) -> dict:
-    # Selection: Anthropic (Decision Logic)
-    agent = SelectionAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"selection_logic": result, "errors": [error]} if error else {"selection_logic": result, "errors": []}
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("selection", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
 
 # ============================================================================
@@ -554,27 +203,141 @@ def selection_agent_node(state: MobilityResearchState) -> dict:
 # ============================================================================
 
 class ScalabilityAgent(BaseMobilityAgent):
-    SCHEMA_PROMPT = '''Generate ONLY:
-
-{
-  "conditions_for_expansion": [],
-  "extensions": []
+    SCHEMA_PROMPT = PROMPTS["scalability"]
+    
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("scalability", self.SCHEMA_PROMPT, llm_instance, model_tier)
+
+
+# ============================================================================
+# AGENT INSTANCES
+# ============================================================================
+
+# Agents are stateless, so each is built once and shared by every node call.
+# Small tier: short list/string sections; large tier: nested, structured ones.
+_AGENTS = {
+    # Evidence: small tier (Data/Facts)
+    "evidence": EvidenceAgent(model_tier="small"),
+    # Impact: large tier (Nuance/Reasoning)
+    "impact": ImpactAgent(model_tier="large"),
+    # Requirements: small tier (Structural)
+    "requirements": RequirementsAgent(model_tier="small"),
+    # Infrastructure: small tier (Technical)
+    "infrastructure": InfrastructureAgent(model_tier="small"),
+    # Operations: large tier (Process/Steps)
+    "operations": OperationsAgent(model_tier="large"),
+    # Costs: small tier (Estimates)
+    "costs": CostsAgent(model_tier="small"),
+    # Risks: small tier (Critical Thinking)
+    "risks": RisksAgent(model_tier="small"),
+    # Monitoring: small tier (Metrics)
+    "monitoring": MonitoringAgent(model_tier="small"),
+    # Checklist: small tier (Procedural)
+    "checklist": ChecklistAgent(model_tier="small"),
+    # Lifecycle: large tier (Sequential)
+    "lifecycle": LifecycleAgent(model_tier="large"),
+    # Roles: large tier (Complex Interactions)
+    "roles": RolesAgent(model_tier="large"),
+    # Financial: large tier (Reasoning)
+    "financial": FinancialAgent(model_tier="large"),
+    # Compliance: large tier (Regulations)
+    "compliance": ComplianceAgent(model_tier="large"),
+    # Visibility: small tier (Visual/Design)
+    "visibility": VisibilityAgent(model_tier="small"),
+    # Selection: large tier (Decision Logic)
+    "selection": SelectionAgent(model_tier="large"),
+    # Scalability: small tier (Future Planning)
+    "scalability": ScalabilityAgent(model_tier="small"),
 }
 
-Explain what conditions signal demand growth or operational expansion.
-Give realistic extensions.
+# State key written by each agent (differs from the section name for some)
+STATE_KEYS = {
+    "evidence": "evidence",
+    "impact": "impact",
+    "requirements": "requirements",
+    "infrastructure": "infrastructure",
+    "operations": "operations",
+    "costs": "costs",
+    "risks": "risks",
+    "monitoring": "monitoring",
+    "checklist": "checklist",
+    "lifecycle": "lifecycle",
+    "roles": "roles_responsibilities_detailed",
+    "financial": "financial_model",
+    "compliance": "compliance",
+    "visibility": "visibility_and_communication_design",
+    "selection": "selection_logic",
+    "scalability": "future_scalability",
+}
 
-Rules:
-- Describe indicators that would justify expansion
-- Explain HOW extensions would build on initial implementation
-- Provide context on timing, demand thresholds, or enabling factors'''
-    
-    def __init__(self, llm_instance=None):
-        super().__init__("scalability", self.SCHEMA_PROMPT, llm_instance)
 
+# ============================================================================
+# NODES
+# ============================================================================
 
-def scalability_agent_node(state: MobilityResearchState) -> dict:
-    # Scalability: Anthropic (Future Planning)
-    agent = ScalabilityAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
-    return {"future_scalability": result, "errors": [error]} if error else {"future_scalability": result, "errors": []}
+def _make_node(section: str):
+    """
+    Create the LangGraph node for one section agent.
+    
+    Args:
+        section: Agent section name (key in _AGENTS)
+        
+    Returns:
+        Async node function writing the section's state key
+    """
+    agent = _AGENTS[section]
+    state_key = STATE_KEYS[section]
+    
+    async def agent_node(state: MobilityResearchState) -> dict:
+        result, error = await agent.agenerate(state["measure_name"], state.get("context", ""))
+        return {state_key: result, "errors": [error] if error else []}
+    
+    agent_node.__name__ = f"{section}_agent_node"
+    return agent_node
+
+
+evidence_agent_node = _make_node("evidence")
+impact_agent_node = _make_node("impact")
+requirements_agent_node = _make_node("requirements")
+infrastructure_agent_node = _make_node("infrastructure")
+operations_agent_node = _make_node("operations")
+costs_agent_node = _make_node("costs")
+risks_agent_node = _make_node("risks")
+monitoring_agent_node = _make_node("monitoring")
+checklist_agent_node = _make_node("checklist")
+lifecycle_agent_node = _make_node("lifecycle")
+roles_agent_node = _make_node("roles")
+financial_agent_node = _make_node("financial")
+compliance_agent_node = _make_node("compliance")
+visibility_agent_node = _make_node("visibility")
+selection_agent_node = _make_node("selection")
+scalability_agent_node = _make_node("scalability")
+
+
+def make_batch_node(section: str):
+    """
+    Create a LangGraph node that runs one section agent over many measures.
+    
+    Measures are sent to the LLM several at a time (see generate_batch),
+    replacing one call per measure with one call per batch.
+    
+    Args:
+        section: Agent section name (key in _AGENTS)
+        
+    Returns:
+        Async node function writing the section list under its state key
+    """
+    agent = _AGENTS[section]
+    state_key = STATE_KEYS[section]
+    
+    async def batch_node(state: MobilityBatchState) -> dict:
+        measures = [(m["measure_name"], m.get("context", "")) for m in state["measures"]]
+        outcomes = await asyncio.to_thread(agent.generate_batch, measures)
+        
+        return {
+            "sections": {state_key: [result for result, _ in outcomes]},
+            "errors": [error for _, error in outcomes if error],
+        }
+    
+    batch_node.__name__ = f"{section}_batch_node"
+    return batch_node
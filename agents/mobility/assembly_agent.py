@@ -5,16 +5,116 @@ This is the final agent that collects outputs from all specialized agents,
 validates them, and assembles the complete JSON document.
 """
 
-import json
-import os
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any
 from schemas.mobility_measure import MobilityResearchState, CompleteMobilityMeasure
-from schemas.validators import validate_complete_measure, merge_sections
+from schemas.validators import merge_and_validate
+from utils.formatting import BAR60
+from utils.json_utils import write_json_file
 from utils.logger import logger
 
 
+# (output section name, state key) in document order
+SECTION_KEYS = (
+    ("meta", "meta"),
+    ("overview", "overview"),
+    ("context", "context_data"),  # Note: context_data due to naming conflict
+    ("evidence", "evidence"),
+    ("impact", "impact"),
+    ("requirements", "requirements"),
+    ("infrastructure", "infrastructure"),
+    ("operations", "operations"),
+    ("costs", "costs"),
+    ("risks", "risks"),
+    ("monitoring", "monitoring"),
+    ("checklist", "checklist"),
+    ("lifecycle", "lifecycle"),
+    ("roles_responsibilities_detailed", "roles_responsibilities_detailed"),
+    ("financial_model", "financial_model"),
+    ("compliance", "compliance"),
+    ("visibility_and_communication_design", "visibility_and_communication_design"),
+    ("selection_logic", "selection_logic"),
+    ("future_scalability", "future_scalability"),
+)
+
+OUTPUT_DIR = Path("research_output")
+
+# Characters in measure names that are unsafe in output filenames
+_FILENAME_TABLE = str.maketrans({" ": "-", "/": "-", "\\": "-"})
+
+
+# Disk writes run here so the workflow returns without waiting on I/O; one
+# worker keeps writes in submission order, so a later save of the same path wins
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="measure-io")
+_pending_writes: Dict[str, Future] = {}
+_pending_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_output_dir() -> Path:
+    """Create the output directory on first save only."""
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    return OUTPUT_DIR
+
+
+def _persist(data: Dict[str, Any], output_path: str, missing_sections: list) -> None:
+    """Write the assembled measure to disk and log the result (runs on _IO_POOL)."""
+    file_size = write_json_file(output_path, data)
+    completion_pct = round((19 - len(missing_sections)) / 19 * 100, 1)
+    
+    logger.info(f"✓ Saved to: {output_path}")
+    logger.info(f"✓ File size: {file_size:,} bytes")
+    logger.info(f"✓ Completion: {completion_pct}% ({19-len(missing_sections)}/19 sections)")
+    
+    if missing_sections:
+        logger.warning(f"⚠ Partial result saved. Missing sections can be completed later.")
+
+
+def _on_persisted(output_path: str, future: Future) -> None:
+    """Log background save failures as soon as they happen."""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to save output: {error}")
+
+
+def wait_for_output(output_path: str, timeout: float = None) -> bool:
+    """
+    Block until a background save of output_path has finished.
+    
+    Args:
+        output_path: Path returned in the assembly state
+        timeout: Optional maximum seconds to wait
+        
+    Returns:
+        True if the file was written (or no save was pending), False on failure
+    """
+    with _pending_lock:
+        future = _pending_writes.pop(output_path, None)
+    
+    if future is None:
+        return True
+    
+    try:
+        future.result(timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+def _deepfreeze(obj: Any) -> Any:
+    """Read-only copy of a JSON-like value: dicts become MappingProxyType, lists tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _deepfreeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_deepfreeze(value) for value in obj)
+    return obj
+
+
 def assembly_agent_node(state: MobilityResearchState) -> dict:
     """
     Final assembly node that combines all agent outputs.
@@ -28,49 +128,22 @@ def assembly_agent_node(state: MobilityResearchState) -> dict:
     Returns:
         Updated state with complete_measure and output_path
     """
-    logger.info("=" * 60)
+    logger.info(BAR60)
     logger.info("ASSEMBLY AGENT: Combining all sections")
-    logger.info("=" * 60)
-    
-    # Collect all sections
-    sections = {
-        "meta": state.get("meta", {}),
-        "overview": state.get("overview", {}),
-        "context": state.get("context_data", {}),  # Note: context_data due to naming conflict
-        "evidence": state.get("evidence", {}),
-        "impact": state.get("impact", {}),
-        "requirements": state.get("requirements", {}),
-        "infrastructure": state.get("infrastructure", {}),
-        "operations": state.get("operations", {}),
-        "costs": state.get("costs", {}),
-        "risks": state.get("risks", {}),
-        "monitoring": state.get("monitoring", {}),
-        "checklist": state.get("checklist", {}),
-        "lifecycle": state.get("lifecycle", {}),
-        "roles_responsibilities_detailed": state.get("roles_responsibilities_detailed", {}),
-        "financial_model": state.get("financial_model", {}),
-        "compliance": state.get("compliance", {}),
-        "visibility_and_communication_design": state.get("visibility_and_communication_design", {}),
-        "selection_logic": state.get("selection_logic", {}),
-        "future_scalability": state.get("future_scalability", {}),
-    }
+    logger.info(BAR60)
+    
+    # Collect, merge and validate all sections in one pass
+    # (missing sections get empty placeholders)
+    sections = {name: state.get(state_key, {}) for name, state_key in SECTION_KEYS}
+    complete_measure, val_errors = merge_and_validate(sections)
     
     # Check for missing sections
-    missing_sections = [name for name, data in sections.items() if not data]
+    missing_sections = [name for name, data in complete_measure.items() if not data]
     
     if missing_sections:
         logger.warning(f"{len(missing_sections)} sections missing or empty: {', '.join(missing_sections)}")
         logger.warning("Saving partial result - users can manually complete missing sections later")
     
-    # Merge all sections (including empty ones with placeholders)
-    complete_measure = {}
-    for name, data in sections.items():
-        if data:
-            complete_measure[name] = data
-        else:
-            # Add placeholder for missing section
-            complete_measure[name] = {}
-            
     # Add metadata about completeness
     if missing_sections:
         complete_measure["_metadata"] = {
@@ -80,68 +153,49 @@ def assembly_agent_node(state: MobilityResearchState) -> dict:
             "generated_at": datetime.now().isoformat(timespec='seconds') + "Z"
         }
     
-    # Validate complete document
     # With Haiku/smaller models, we want to be lenient and save even if validation fails
-    try:
-        from schemas.validators import validate_complete_measure
-        is_valid, val_errors = validate_complete_measure(complete_measure)
-        
-        if not is_valid:
-            logger.warning(f"Validation warnings: {val_errors}")
-            # We add validation errors to metadata but STILL SAVE the file
-            if "_metadata" not in complete_measure:
-                complete_measure["_metadata"] = {}
-                
-            complete_measure["_metadata"]["validation_errors"] = val_errors
-            complete_measure["_metadata"]["is_valid"] = False
-        else:
-            if "_metadata" not in complete_measure:
-                complete_measure["_metadata"] = {}
-            complete_measure["_metadata"]["is_valid"] = True
-            
-    except Exception as e:
-        logger.warning(f"Validation skipped due to error: {e}")
+    metadata = complete_measure.setdefault("_metadata", {})
+    
+    if val_errors:
+        logger.warning(f"Validation warnings: {val_errors}")
+        # We add validation errors to metadata but STILL SAVE the file
+        metadata["validation_errors"] = val_errors
+    
+    metadata["is_valid"] = not val_errors
     
     # Generate output filename
     measure_name = state.get("measure_name", "unknown")
-    safe_name = measure_name.lower().replace(" ", "-").replace("/", "-")
-    output_dir = "research_output"
-    os.makedirs(output_dir, exist_ok=True)
+    safe_name = measure_name.lower().translate(_FILENAME_TABLE)
     
     # Add '-partial' suffix if incomplete
     suffix = "-partial" if missing_sections else ""
     output_filename = f"{safe_name}-mobility-measure{suffix}.json"
-    output_path = os.path.join(output_dir, output_filename)
+    output_path = str(_ensure_output_dir() / output_filename)
     
-    # Save JSON file
+    # Save JSON file in the background; callers that need the file on disk
+    # use wait_for_output(output_path)
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(complete_measure, f, indent=2, ensure_ascii=False)
-        
-        file_size = os.path.getsize(output_path)
-        completion_pct = round((19 - len(missing_sections)) / 19 * 100, 1)
-        
-        logger.info(f"✓ Saved to: {output_path}")
-        logger.info(f"✓ File size: {file_size:,} bytes")
-        logger.info(f"✓ Completion: {completion_pct}% ({19-len(missing_sections)}/19 sections)")
-        
-        if missing_sections:
-            logger.warning(f"⚠ Partial result saved. Missing sections can be completed later.")
-    
+        future = _IO_POOL.submit(_persist, complete_measure, output_path, missing_sections)
     except Exception as e:
         logger.error(f"Failed to save output: {e}")
         return {
-            "complete_measure": complete_measure,
+            "complete_measure": _deepfreeze(complete_measure),
             "output_path": "",
             "errors": [f"Save error: {str(e)}"]
         }
     
-    logger.info("=" * 60)
+    with _pending_lock:
+        _pending_writes[output_path] = future
+    future.add_done_callback(functools.partial(_on_persisted, output_path))
+    
+    logger.info(BAR60)
     logger.info("ASSEMBLY COMPLETE")
-    logger.info("=" * 60)
+    logger.info(BAR60)
     
+    # The writer thread may still be serializing complete_measure; callers get
+    # a read-only copy so they can never race with it
     return {
-        "complete_measure": complete_measure,
+        "complete_measure": _deepfreeze(complete_measure),
         "output_path": output_path,
         "errors": []
     }
@@ -158,19 +212,14 @@ def save_mobility_measure(data: Dict[str, Any], measure_name: str) -> str:
     Returns:
         Absolute path to saved file
     """
-    # Create research_output directory
-    output_dir = Path("research_output")
-    output_dir.mkdir(exist_ok=True)
-    
     # Generate filename: name-mobility-measure.json
     # Clean measure_name for filesystem
-    clean_name = measure_name.lower().replace(" ", "-").replace("/", "-")
+    clean_name = measure_name.lower().translate(_FILENAME_TABLE)
     filename = f"{clean_name}-mobility-measure.json"
     
-    output_path = output_dir / filename
+    output_path = _ensure_output_dir() / filename
     
     # Save with pretty printing
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json_file(output_path, data)
     
     return str(output_path.absolute())
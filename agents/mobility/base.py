@@ -1,11 +1,67 @@
 """Base class for all mobility measure agents."""
 
+import asyncio
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
-from langchain_core.messages import SystemMessage, HumanMessage
-from config.llm import llm
-from utils.json_utils import safe_json_parse
+from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
+from config.llm import get_llm, llm_admission, get_fallback_llm, get_llm_for_tier, supports_prompt_caching
+from config.settings import settings
+from schemas.mobility_measure import SECTION_SCHEMAS
+from schemas.validators import SECTION_VALIDATORS
+from utils.json_utils import (
+    IncrementalJsonParser,
+    dumps_json,
+    extract_json_array_from_text,
+    extract_json_from_text,
+    loads_json,
+    safe_json_parse,
+)
 from utils.logger import logger
 from agents.mobility.json_fixer import JsonFixerAgent
+from agents.mobility.cache import cached_generate, get_cached, store_cached
+from agents.mobility.errors import AgentError, AgentResult, ErrorCode, classify_error
+
+
+# "Please try again in 1.5s" / "try again in 250ms" hint in 429 messages
+_RETRY_RE = re.compile(r'try again in ([\d.]+)(ms|s)')
+
+# Stateless, so one instance serves every agent
+_FIXER = JsonFixerAgent()
+
+# Process-wide token totals across every agent call (see token_usage())
+_TOKEN_COUNTER: Counter = Counter()
+_token_lock = threading.Lock()
+
+# UNIVERSAL_PROMPT is identical across agents and measures, so it can be kept
+# longer than the per-agent schema block (which uses the default 5m TTL)
+_UNIVERSAL_CACHE_CONTROL = (
+    {"type": "ephemeral", "ttl": settings.PROMPT_CACHE_TTL}
+    if settings.PROMPT_CACHE_TTL != "5m" else {"type": "ephemeral"}
+)
+
+
+def token_usage() -> Dict[str, int]:
+    """
+    Token totals for all LLM calls made by agents in this process.
+    
+    cache_read / cache_write show whether prompt caching is working
+    (Anthropic reports them; other providers report 0).
+    
+    Returns:
+        Dict with calls, input, output, cache_read and cache_write counts
+    """
+    with _token_lock:
+        return {
+            key: _TOKEN_COUNTER[key]
+            for key in ("calls", "input", "output", "cache_read", "cache_write")
+        }
 
 
 class BaseMobilityAgent:
@@ -19,6 +75,8 @@ class BaseMobilityAgent:
     - Consistent error handling
     """
     
+    # Shared cache prefix for every agent and measure: keep it byte-identical
+    # (no per-agent or per-call formatting) or Anthropic prompt caching misses
     UNIVERSAL_PROMPT = """You are a Mobility Research Agent. Your task is to generate a specific section of a mobility measure using clear, descriptive, research-informed content.
 
 GENERAL RULES:
@@ -34,7 +92,7 @@ GENERAL RULES:
 
 Your output must help the reader understand the concept, not merely list steps."""
     
-    def __init__(self, section_name: str, schema_prompt: str, llm_instance=None):
+    def __init__(self, section_name: str, schema_prompt: str, llm_instance=None, model_tier: str = None):
         """
         Initialize the mobility agent.
         
@@ -42,12 +100,23 @@ Your output must help the reader understand the concept, not merely list steps."
             section_name: Name of the JSON section this agent produces
             schema_prompt: Section-specific schema and rules
             llm_instance: Optional specific LLM instance to use (overrides default)
+            model_tier: Optional "small" or "large" model routing (used when
+                no llm_instance is given). Small-tier output that fails
+                schema validation is regenerated on the large tier.
         """
         self.section_name = section_name
         self.schema_prompt = schema_prompt
-        self.llm = llm_instance if llm_instance else llm
+        self.rules_prompt = self._strip_structural_template(schema_prompt)
+        self.model_tier = model_tier
+        self._system_messages = {}
+        
+        if llm_instance is None and model_tier:
+            llm_instance = get_llm_for_tier(model_tier)
+        
+        self.llm = llm_instance if llm_instance else get_llm()
     
-    def generate(self, measure_name: str, context: str = "") -> tuple:
+    @cached_generate
+    def generate(self, measure_name: str, context: str = "") -> AgentResult:
         """
         Generate JSON section for this agent.
         
@@ -56,36 +125,119 @@ Your output must help the reader understand the concept, not merely list steps."
             context: Additional context
             
         Returns:
-            Tuple of (result_dict, error_message)
+            AgentResult(data, error): error is None on success, otherwise an
+            AgentError (a str) whose .code gives the failure type
         """
-        import time
-        import random
-        from config.settings import settings
+        # One admission slot covers the call plus any escalation/retry
+        with llm_admission.admit(self._estimate_tokens()):
+            return self._generate_validated(measure_name, context)
+    
+    def _generate_validated(self, measure_name: str, context: str = "") -> tuple:
+        """Generate, validate against the schema, and escalate/retry if invalid."""
+        active_llm = self.llm
+        result, error = self._generate_with(active_llm, measure_name, context)
+        if error:
+            return result, error
         
-        # Rate limiting: add random delay to spread out parallel requests
-        if settings.ENABLE_RATE_LIMITING:
-            delay = random.uniform(
-                settings.REQUEST_DELAY_MIN,
-                settings.REQUEST_DELAY_MAX
-            )
-            logger.debug(f"[{self.section_name}] Rate limiting delay: {delay:.2f}s")
-            time.sleep(delay)
+        schema_errors = self._schema_errors(result)
         
-        logger.info(f"[{self.section_name}] Generating section for: {measure_name}")
+        # Cascade: escalate small-tier output that does not match the schema
+        if schema_errors and self.model_tier == "small":
+            large_llm = get_llm_for_tier("large")
+            
+            if large_llm is not None and large_llm is not self.llm:
+                logger.warning(f"[{self.section_name}] Output does not match schema, escalating to large model...")
+                active_llm = large_llm
+                result, error = self._generate_with(active_llm, measure_name, context)
+                if error:
+                    return result, error
+                schema_errors = self._schema_errors(result)
         
-        # Construct full prompt
-        full_prompt = f"{self.UNIVERSAL_PROMPT}\n\n{self.schema_prompt}\n\nMobility Measure: {measure_name}"
+        if schema_errors:
+            result = self._retry_invalid(active_llm, result, schema_errors, measure_name, context)
         
-        if context:
-            full_prompt += f"\nContext: {context}"
+        return result, None
+    
+    def _estimate_tokens(self, measures: int = 1) -> int:
+        """Rough token cost of one request (prompt at ~4 chars/token plus output budget)."""
+        prompt_tokens = (len(self.UNIVERSAL_PROMPT) + len(self.schema_prompt)) // 4
+        max_tokens = getattr(self.llm, "max_tokens", None) or settings.MAX_TOKENS
+        return prompt_tokens + max_tokens * measures
+    
+    def _schema_errors(self, result: dict) -> list:
+        """Validate a result against the section's compiled schema validator."""
+        validator = SECTION_VALIDATORS.get(self.section_name)
+        return validator(result) if validator else []
+    
+    def _retry_invalid(self, llm_instance, result: dict, schema_errors: list, measure_name: str, context: str = "") -> dict:
+        """
+        Ask the model once to re-emit a section that failed schema validation.
+        
+        Args:
+            llm_instance: LLM that produced the invalid section
+            result: Parsed but invalid section
+            schema_errors: Validator messages for the result
+            measure_name: Name of mobility measure
+            context: Additional context
+            
+        Returns:
+            The corrected section if it validates, otherwise the original result
+        """
+        logger.warning(f"[{self.section_name}] Schema validation failed: {'; '.join(schema_errors)}. Retrying once...")
+        
+        messages = self._build_messages(llm_instance, measure_name, context) + [
+            AIMessage(content=dumps_json(result)),
+            HumanMessage(content=(
+                f"Your previous JSON was invalid: {'; '.join(schema_errors)}. "
+                "Re-emit the complete corrected JSON for this section only."
+            )),
+        ]
         
         try:
-            # Invoke LLM - use the llm instance from config
-            response = self.llm.invoke(full_prompt)
+            response = self._invoke(llm_instance, messages)
+            self._log_usage(response)
+            retried, parse_error = safe_json_parse(extract_json_from_text(response.content))
+        except Exception as e:
+            logger.warning(f"[{self.section_name}] Schema retry failed: {e}")
+            return result
+        
+        if parse_error or self._schema_errors(retried):
+            logger.warning(f"[{self.section_name}] Schema retry still invalid, keeping original output")
+            return result
+        
+        logger.info(f"[{self.section_name}] ✓ Section corrected after schema retry")
+        return retried
+    
+    def _generate_with(self, llm_instance, measure_name: str, context: str = "") -> tuple:
+        """
+        Run one generation against a specific LLM, with retry and fallback.
+        
+        Args:
+            llm_instance: LLM to call
+            measure_name: Name of mobility measure
+            context: Additional context
             
-            # Extract and parse JSON
-            from utils.json_utils import extract_json_from_text, safe_json_parse
+        Returns:
+            Tuple of (result_dict, error_message)
+        """
+        logger.info(f"[{self.section_name}] Generating section for: {measure_name}")
+        
+        # Static prompt first, measure-specific text last (cacheable prefix)
+        messages = self._build_messages(llm_instance, measure_name, context)
+        
+        try:
+            # Native structured output: the provider enforces the section schema
+            schema = self._structured_schema()
+            if schema is not None:
+                result = self._invoke_structured(llm_instance, schema, measure_name, context)
+                if result is not None:
+                    logger.info(f"[{self.section_name}] ✓ Section generated successfully (structured output)")
+                    return result, None
+            
+            response = self._invoke(llm_instance, messages)
+            self._log_usage(response)
             
+            # Extract and parse JSON
             json_text = extract_json_from_text(response.content)
             result, parse_error = safe_json_parse(json_text)
             
@@ -94,12 +246,11 @@ Your output must help the reader understand the concept, not merely list steps."
                 logger.warning(f"[{self.section_name}] {error_msg}. Attempting to fix...")
                 
                 # Attempt to fix
-                fixer = JsonFixerAgent()
-                result, fix_error = fixer.fix_json(json_text, parse_error, full_prompt)
+                result, fix_error = _FIXER.fix_json(json_text, parse_error, self.schema_prompt)
                 
                 if fix_error:
                     logger.error(f"[{self.section_name}] Fix failed: {fix_error}")
-                    return {}, f"{error_msg}. Fix failed: {fix_error}"
+                    return {}, AgentError(f"{error_msg}. Fix failed: {fix_error}", ErrorCode.PARSE)
                 
                 logger.info(f"[{self.section_name}] ✓ Section generated and repaired successfully")
                 return result, None
@@ -109,55 +260,20 @@ Your output must help the reader understand the concept, not merely list steps."
             
         except Exception as e:
             error_str = str(e)
+            error_code = classify_error(e)
             
-            # Check if it's a rate limit error (429)
-            if "429" in error_str or "rate_limit" in error_str.lower():
-                # Extract suggested wait time from error message
-                import re
-                wait_match = re.search(r'try again in ([\d.]+)([ms])', error_str)
-                
-                if wait_match:
-                    wait_value = float(wait_match.group(1))
-                    wait_unit = wait_match.group(2)
-                    
-                    # Convert to seconds
-                    wait_time = wait_value if wait_unit == 's' else wait_value / 1000
-                    wait_time = min(wait_time, 10.0)  # Cap at 10 seconds
-                    
-                    logger.info(f"[{self.section_name}] Rate limit hit. Waiting {wait_time:.1f}s before retry...")
-                    time.sleep(wait_time + 0.5)  # Add small buffer
-                    
-                    # Retry with same model once
-                    try:
-                        response = self.llm.invoke(full_prompt)
-                        
-                        from utils.json_utils import extract_json_from_text, safe_json_parse
-                        json_text = extract_json_from_text(response.content)
-                        result, parse_error = safe_json_parse(json_text)
-                        
-                        if not parse_error:
-                            logger.info(f"[{self.section_name}] ✓ Section generated after retry")
-                            return result, None
-                    except Exception as retry_error:
-                        logger.debug(f"[{self.section_name}] Retry failed, trying fallback...")
-                
-                # Retry failed or no wait time found, try fallback model
-                logger.warning(f"[{self.section_name}] Trying fallback model...")
+            # Still rate limited after backing off (429), try fallback model
+            if error_code is ErrorCode.RATE_LIMIT:
+                logger.warning(f"[{self.section_name}] Rate limit retries exhausted. Trying fallback model...")
                 
                 try:
-                    from config.settings import settings
-                    from langchain_groq import ChatGroq
+                    fallback_llm = get_fallback_llm()
                     
-                    fallback_llm = ChatGroq(
-                        api_key=settings.GROQ_API_KEY,
-                        model=settings.FALLBACK_MODEL,
-                        temperature=settings.TEMPERATURE,
-                        max_tokens=settings.MAX_TOKENS,
+                    response = fallback_llm.invoke(
+                        self._build_messages(fallback_llm, measure_name, context)
                     )
+                    self._log_usage(response)
                     
-                    response = fallback_llm.invoke(full_prompt)
-                    
-                    from utils.json_utils import extract_json_from_text, safe_json_parse
                     json_text = extract_json_from_text(response.content)
                     result, parse_error = safe_json_parse(json_text)
                     
@@ -165,12 +281,11 @@ Your output must help the reader understand the concept, not merely list steps."
                         error_msg = f"JSON parsing error (fallback): {parse_error}"
                         logger.warning(f"[{self.section_name}] {error_msg}. Attempting to fix...")
                         
-                        fixer = JsonFixerAgent()
-                        result, fix_error = fixer.fix_json(json_text, parse_error, full_prompt)
+                        result, fix_error = _FIXER.fix_json(json_text, parse_error, self.schema_prompt)
                         
                         if fix_error:
                             logger.error(f"[{self.section_name}] Fix failed: {fix_error}")
-                            return {}, f"{error_msg}. Fix failed: {fix_error}"
+                            return {}, AgentError(f"{error_msg}. Fix failed: {fix_error}", ErrorCode.PARSE)
                             
                         logger.info(f"[{self.section_name}] ✓ Section generated and repaired with fallback")
                         return result, None
@@ -181,12 +296,450 @@ Your output must help the reader understand the concept, not merely list steps."
                 except Exception as fallback_error:
                     error_msg = f"Error in fallback for {self.section_name}: {str(fallback_error)}"
                     logger.error(f"[{self.section_name}] {error_msg}")
-                    return {}, error_msg
+                    return {}, AgentError(error_msg, classify_error(fallback_error))
             
-            # Not a rate limit error, return original error
+            # Not a rate limit error (auth, network, ...), return original error
             error_msg = f"Error generating {self.section_name}: {error_str}"
-            logger.error(f"[{self.section_name}] {error_msg}")
-            return {}, error_msg
+            logger.error(f"[{self.section_name}] {error_msg} [{error_code.value}]")
+            return {}, AgentError(error_msg, error_code)
+    
+    def generate_batch(self, measures: list) -> list:
+        """
+        Generate this agent's section for several measures with shared LLM calls.
+        
+        Cached measures are served from the completion cache; the rest are sent
+        k at a time in one prompt that asks for a JSON array with one section
+        per measure. k is capped so k x MAX_TOKENS stays within BATCH_MAX_TOKENS.
+        A batch whose response cannot be split back into k sections is retried
+        measure by measure, as is any batch section failing schema validation.
+        Batches (and per-measure retries) run concurrently, up to
+        LLM_MAX_CONCURRENCY calls in flight.
+        
+        Args:
+            measures: List of (measure_name, context) tuples
+        
+        Returns:
+            List of AgentResult(data, error), in input order
+        """
+        results = [None] * len(measures)
+        pending = []
+        
+        for i, (measure_name, context) in enumerate(measures):
+            cached = get_cached(self, measure_name, context)
+            if cached is not None:
+                results[i] = AgentResult(cached, None)
+            else:
+                pending.append(i)
+        
+        if not pending:
+            return results
+        
+        batch_size = max(1, settings.BATCH_MAX_TOKENS // settings.MAX_TOKENS)
+        chunks = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=min(len(chunks), settings.LLM_MAX_CONCURRENCY)) as pool:
+            chunk_results = pool.map(
+                lambda indices: self._generate_chunk([measures[i] for i in indices]),
+                chunks,
+            )
+            
+            for indices, outcomes in zip(chunks, chunk_results):
+                for i, result in zip(indices, outcomes):
+                    results[i] = result
+        
+        return results
+    
+    def _generate_chunk(self, chunk: list) -> list:
+        """
+        Generate one batch, falling back to concurrent per-measure calls.
+        
+        Batch sections that fail schema validation are not cached; those
+        measures go through generate() (escalation, schema retry) instead.
+        
+        Args:
+            chunk: List of (measure_name, context) tuples
+        
+        Returns:
+            List of AgentResult(data, error), in chunk order
+        """
+        sections = self._generate_batch_call(chunk) if len(chunk) > 1 else None
+        
+        if sections is None:
+            sections = [None] * len(chunk)
+        
+        results = [None] * len(chunk)
+        invalid = []
+        
+        for i, ((name, ctx), section) in enumerate(zip(chunk, sections)):
+            if section is not None and not self._schema_errors(section):
+                store_cached(self, name, ctx, section)
+                results[i] = AgentResult(section, None)
+            else:
+                invalid.append(i)
+        
+        if invalid:
+            if len(invalid) < len(chunk):
+                logger.warning(
+                    f"[{self.section_name}] {len(invalid)} batch section(s) failed schema validation, "
+                    "generating them individually..."
+                )
+            
+            with ThreadPoolExecutor(max_workers=min(len(invalid), settings.LLM_MAX_CONCURRENCY)) as pool:
+                for i, result in zip(invalid, pool.map(lambda i: self.generate(*chunk[i]), invalid)):
+                    results[i] = result
+        
+        return results
+    
+    def _generate_batch_call(self, measures: list):
+        """
+        Run one LLM call producing this section for every measure in the list.
+        
+        Args:
+            measures: List of (measure_name, context) tuples
+        
+        Returns:
+            List of section dicts in input order, or None if the call failed
+            or the response did not contain one object per measure
+        """
+        if self.llm is None:
+            return None
+        
+        logger.info(f"[{self.section_name}] Generating section for {len(measures)} measures in one call")
+        
+        listing = "\n".join(
+            f"{i}) {name}" + (f" — {ctx}" if ctx else "")
+            for i, (name, ctx) in enumerate(measures, 1)
+        )
+        user_text = (
+            f"Generate this section for each of the following {len(measures)} mobility measures. "
+            f"Output a JSON array of {len(measures)} objects where element i is the section "
+            f"for measure i.\n\n{listing}"
+        )
+        
+        # Room for every measure's section in one response
+        batch_llm = self.llm.model_copy(
+            update={"max_tokens": settings.MAX_TOKENS * len(measures)}
+        )
+        system_message = self._build_messages(batch_llm, "")[0]
+        
+        try:
+            with llm_admission.admit(self._estimate_tokens(len(measures))):
+                response = self._invoke(batch_llm, [system_message, HumanMessage(content=user_text)])
+            self._log_usage(response)
+            sections = loads_json(extract_json_array_from_text(response.content))
+        except Exception as e:
+            logger.warning(f"[{self.section_name}] Batch call failed ({e}), generating individually...")
+            return None
+        
+        if (
+            not isinstance(sections, list)
+            or len(sections) != len(measures)
+            or not all(isinstance(section, dict) and section for section in sections)
+        ):
+            logger.warning(f"[{self.section_name}] Batch response did not match measures, generating individually...")
+            return None
+        
+        logger.info(f"[{self.section_name}] ✓ Batch of {len(measures)} sections generated successfully")
+        return sections
+
+    def generate_stream(self, measure_name: str, context: str = ""):
+        """
+        Stream this agent's section, yielding top-level keys as they complete.
+        
+        Lets callers consume finished keys (e.g. "developer" in the roles
+        section) while later keys are still being generated. If the streamed
+        object cannot be decoded incrementally, the full text goes through the
+        usual parse/repair path once the stream ends and the remaining keys are
+        yielded then. Streaming bypasses the completion cache and model cascade,
+        but still takes an admission slot for as long as the stream is open.
+        
+        Args:
+            measure_name: Name of mobility measure
+            context: Additional context
+        
+        Yields:
+            Tuple of (key, value) for each completed top-level key
+        
+        Returns:
+            The complete section dict (as the generator's return value)
+        """
+        logger.info(f"[{self.section_name}] Streaming section for: {measure_name}")
+        
+        messages = self._build_messages(self.llm, measure_name, context)
+        parser = IncrementalJsonParser()
+        chunks = []
+        
+        with llm_admission.admit(self._estimate_tokens()):
+            for chunk in self.llm.stream(messages):
+                text = self._chunk_text(chunk.content)
+                chunks.append(text)
+                yield from parser.feed(text)
+        
+        if parser.done and not parser.failed:
+            logger.info(f"[{self.section_name}] ✓ Section streamed successfully")
+            return parser.result
+        
+        # Incomplete stream or a member that failed to decode: fall back to whole-text parsing
+        json_text = extract_json_from_text("".join(chunks))
+        result, parse_error = safe_json_parse(json_text)
+        
+        if parse_error:
+            logger.warning(f"[{self.section_name}] JSON parsing error: {parse_error}. Attempting to fix...")
+            result, fix_error = _FIXER.fix_json(json_text, parse_error, self.schema_prompt)
+            if fix_error:
+                raise ValueError(f"JSON parsing error: {parse_error}. Fix failed: {fix_error}")
+        
+        for key, value in result.items():
+            if key not in parser.result:
+                yield key, value
+        
+        return result
+    
+    @staticmethod
+    def _chunk_text(content) -> str:
+        """Extract text from a streamed chunk (plain string or content blocks)."""
+        if isinstance(content, str):
+            return content
+        return "".join(
+            block.get("text", "") for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        )
+
+    def _structured_schema(self):
+        """Section TypedDict to enforce via structured output, or None if disabled."""
+        if not settings.STRUCTURED_OUTPUT:
+            return None
+        return SECTION_SCHEMAS.get(self.section_name)
+    
+    def _invoke_structured(self, llm_instance, schema, measure_name: str, context: str = ""):
+        """
+        Generate the section through the provider's tool/function-calling API.
+        
+        Rate-limit errors propagate to the caller's retry handling; any other
+        failure returns None so the caller falls back to the JSON prompt.
+        
+        Args:
+            llm_instance: LLM to call
+            schema: Section TypedDict passed as the tool schema
+            measure_name: Name of mobility measure
+            context: Additional context
+            
+        Returns:
+            Section dict, or None if structured output was not produced
+        """
+        messages = self._build_messages(llm_instance, measure_name, context, structured=True)
+        
+        try:
+            output = self._invoke(llm_instance.with_structured_output(schema, include_raw=True), messages)
+        except Exception as e:
+            # The JSON prompt would hit the same limit or credential problem
+            if classify_error(e) in (ErrorCode.RATE_LIMIT, ErrorCode.AUTH):
+                raise
+            logger.warning(f"[{self.section_name}] Structured output failed ({e}), falling back to JSON prompt...")
+            return None
+        
+        self._log_usage(output["raw"])
+        parsed = output.get("parsed")
+        
+        if output.get("parsing_error") or not isinstance(parsed, dict) or not parsed:
+            logger.warning(f"[{self.section_name}] Structured output unusable, falling back to JSON prompt...")
+            return None
+        
+        return parsed
+    
+    def _invoke(self, runnable, messages):
+        """
+        Invoke an LLM, backing off exponentially (with jitter) on 429s.
+        
+        Waits the provider's Retry-After hint when given, otherwise
+        RATE_LIMIT_BACKOFF_INITIAL x 2^attempt plus jitter, capped at
+        RATE_LIMIT_BACKOFF_MAX seconds. After RATE_LIMIT_RETRIES retries the
+        last rate-limit error is raised; other errors are raised immediately.
+        
+        Args:
+            runnable: LLM (or structured-output runnable) to call
+            messages: Messages to send
+            
+        Returns:
+            The runnable's response
+        """
+        for attempt in range(settings.RATE_LIMIT_RETRIES + 1):
+            try:
+                return runnable.invoke(messages)
+            except Exception as e:
+                if attempt == settings.RATE_LIMIT_RETRIES or classify_error(e) is not ErrorCode.RATE_LIMIT:
+                    raise
+                
+                wait_time = self._retry_after(e)
+                if wait_time is None:
+                    backoff = settings.RATE_LIMIT_BACKOFF_INITIAL * 2 ** attempt
+                    wait_time = backoff + random.uniform(0, backoff)
+                wait_time = min(wait_time, settings.RATE_LIMIT_BACKOFF_MAX)
+                
+                logger.info(
+                    f"[{self.section_name}] Rate limit hit. Waiting {wait_time:.1f}s before retry "
+                    f"{attempt + 1}/{settings.RATE_LIMIT_RETRIES}..."
+                )
+                time.sleep(wait_time)
+    
+    @staticmethod
+    def _retry_after(error: Exception):
+        """
+        Seconds the provider asked us to wait before retrying a 429.
+        
+        Prefers the Retry-After response header; falls back to the
+        "try again in 1.5s" hint in the error message.
+        
+        Returns:
+            Wait time in seconds, or None if the provider gave no hint
+        """
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("retry-after")
+        
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        
+        wait_match = _RETRY_RE.search(str(error))
+        if not wait_match:
+            return None
+        
+        wait_value = float(wait_match.group(1))
+        return wait_value if wait_match.group(2) == 's' else wait_value / 1000
+    
+    @staticmethod
+    def _strip_structural_template(schema_prompt: str) -> str:
+        """
+        Remove the JSON skeleton from a schema prompt, keeping only its rules.
+        
+        With structured output the provider receives the schema as a tool
+        definition, so an all-empty skeleton ({"key": "", "list": []}) only
+        repeats it. Skeletons carrying example values (e.g. meta's "1-5"
+        levels) are kept because they say more than the schema does.
+        """
+        match = re.search(r"^\{\n.*?^\}\n*", schema_prompt, re.M | re.S)
+        if not match:
+            return schema_prompt
+        
+        def is_empty(value) -> bool:
+            if isinstance(value, dict):
+                return all(is_empty(v) for v in value.values())
+            return value in ("", [])
+        
+        try:
+            skeleton = loads_json(match.group(0))
+        except json.JSONDecodeError:
+            return schema_prompt
+        
+        if not is_empty(skeleton):
+            return schema_prompt
+        return schema_prompt[:match.start()] + schema_prompt[match.end():]
+    
+    def _build_messages(self, llm_instance, measure_name: str, context: str = "", structured: bool = False) -> list:
+        """
+        Build chat messages with the static prompt as a cacheable prefix.
+        
+        UNIVERSAL_PROMPT + schema_prompt never change for an agent, so they go
+        first as the system message and only the measure/context varies in the
+        user message. Anthropic models get explicit cache breakpoints after
+        UNIVERSAL_PROMPT (shared by every agent) and after the schema; other
+        providers cache identical prefixes automatically.
+        
+        Args:
+            llm_instance: LLM the messages will be sent to
+            measure_name: Name of mobility measure
+            context: Additional context
+            structured: Use the rules-only prompt (schema sent as a tool instead)
+            
+        Returns:
+            List of [SystemMessage, HumanMessage]
+        """
+        system_message = self._system_message(supports_prompt_caching(llm_instance), structured)
+        
+        user_text = f"Mobility Measure: {measure_name}"
+        if context:
+            user_text += f"\nContext: {context}"
+        
+        return [system_message, HumanMessage(content=user_text)]
+    
+    def _system_message(self, cache_breakpoint: bool, structured: bool) -> SystemMessage:
+        """
+        Get the agent's static system message, built once per variant.
+        
+        Args:
+            cache_breakpoint: Mark the prompt blocks with Anthropic cache_control
+            structured: Use the rules-only prompt
+            
+        Returns:
+            Shared SystemMessage for this agent
+        """
+        key = (cache_breakpoint, structured)
+        system_message = self._system_messages.get(key)
+        
+        if system_message is None:
+            schema_text = self.rules_prompt if structured else self.schema_prompt
+            
+            if cache_breakpoint:
+                system_message = SystemMessage(content=[
+                    {
+                        "type": "text",
+                        "text": self.UNIVERSAL_PROMPT,
+                        "cache_control": _UNIVERSAL_CACHE_CONTROL,
+                    },
+                    {
+                        "type": "text",
+                        "text": schema_text,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                ])
+            else:
+                system_message = SystemMessage(content=f"{self.UNIVERSAL_PROMPT}\n\n{schema_text}")
+            
+            self._system_messages[key] = system_message
+        
+        return system_message
+    
+    def _log_usage(self, response) -> None:
+        """Log token usage, including prompt-cache reads, and add it to token_usage()."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        details = usage.get("input_token_details") or {}
+        counts = {
+            "calls": 1,
+            "input": usage.get("input_tokens") or 0,
+            "output": usage.get("output_tokens") or 0,
+            "cache_read": details.get("cache_read") or 0,
+            "cache_write": details.get("cache_creation") or 0,
+        }
+        
+        with _token_lock:
+            _TOKEN_COUNTER.update(counts)
+        
+        # Called for every response: skip building the message at INFO level
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.section_name}] Tokens in={counts['input']} "
+                f"out={counts['output']} "
+                f"cache_read={counts['cache_read']} "
+                f"cache_write={counts['cache_write']}"
+            )
+    
+    async def agenerate(self, measure_name: str, context: str = "") -> AgentResult:
+        """
+        Async variant of generate() for concurrent graph execution.
+        
+        The blocking LLM call runs in a worker thread so independent agents
+        awaited together overlap their network round-trips.
+        
+        Args:
+            measure_name: Name of mobility measure
+            context: Additional context
+            
+        Returns:
+            AgentResult(data, error)
+        """
+        return await asyncio.to_thread(self.generate, measure_name, context)
     
     def __str__(self) -> str:
         """String representation."""
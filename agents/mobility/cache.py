@@ -0,0 +1,219 @@
+"""
+Completion cache for mobility agents.
+
+Identical requests (same agent, schema, model, measure and context) are served
+from an in-process LRU backed by a SQLite file, so repeat runs skip the LLM
+call entirely. Set CACHE_DISABLE=true to force fresh generations.
+"""
+
+import copy
+import functools
+import os
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, Optional
+
+from agents.mobility.errors import AgentResult
+from config.settings import settings
+from utils.disk_cache import DiskCache
+from utils.semantic_cache import SemanticCache
+from utils.logger import logger
+
+
+MEMORY_CACHE_SIZE = 4096
+
+_memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+_disk: Optional[DiskCache] = None
+_disk_lock = threading.Lock()
+_semantic: Optional[SemanticCache] = None
+_semantic_unavailable = False
+_semantic_lock = threading.Lock()
+
+
+def _get_disk_cache() -> DiskCache:
+    """Get or create the shared on-disk cache (one instance even when agents start together)."""
+    global _disk
+    if _disk is None:
+        with _disk_lock:
+            if _disk is None:
+                _disk = DiskCache(
+                    os.path.join(settings.CACHE_DIR, "llm_sections.sqlite"),
+                    settings.CACHE_TTL_SECONDS,
+                )
+    return _disk
+
+
+def _get_semantic_cache() -> Optional[SemanticCache]:
+    """Get or create the shared semantic cache, or None when disabled/unavailable."""
+    global _semantic, _semantic_unavailable
+    if not settings.SEMANTIC_CACHE_ENABLE or _semantic_unavailable:
+        return None
+
+    with _semantic_lock:
+        if _semantic is None and not _semantic_unavailable:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                logger.warning("Semantic cache disabled: sentence-transformers is not installed")
+                _semantic_unavailable = True
+                return None
+
+            model = SentenceTransformer(settings.SEMANTIC_CACHE_MODEL)
+            _semantic = SemanticCache(
+                os.path.join(settings.CACHE_DIR, "llm_sections_semantic.sqlite"),
+                settings.CACHE_TTL_SECONDS,
+                settings.SEMANTIC_CACHE_THRESHOLD,
+                lambda text: model.encode(text).tolist(),
+            )
+    return _semantic
+
+
+def _model_id(llm_instance) -> str:
+    """Best-effort model identifier (with sampling temperature) for cache keys."""
+    model = getattr(llm_instance, "model_name", None) or getattr(llm_instance, "model", "") or ""
+    return f"{model}@{getattr(llm_instance, 'temperature', None)}"
+
+
+def cache_key(section_name: str, schema_prompt: str, model: str, measure_name: str, context: str) -> str:
+    """
+    Build a stable cache key for one section request.
+
+    Args:
+        section_name: Agent section name
+        schema_prompt: Full system prompt (changes invalidate old entries)
+        model: Model identifier, including temperature
+        measure_name: Name of mobility measure
+        context: Additional context
+
+    Returns:
+        Hex digest identifying the request
+    """
+    raw = f"{section_name}|{schema_prompt}|{model}|{measure_name}|{context}"
+    return blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _lookup(key: str) -> Optional[Dict[str, Any]]:
+    """Check the memory cache, then the disk cache."""
+    with _memory_lock:
+        if key in _memory:
+            _memory.move_to_end(key)
+            return _memory[key]
+
+    value = _get_disk_cache().get(key)
+    if value is not None:
+        _remember(key, value)
+    return value
+
+
+def _remember(key: str, value: Dict[str, Any]) -> None:
+    """Insert into the memory LRU, evicting the oldest entry when full."""
+    with _memory_lock:
+        _memory[key] = value
+        _memory.move_to_end(key)
+        if len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def _keys(agent, measure_name: str, context: str) -> tuple:
+    """Exact cache key and semantic namespace for one agent request."""
+    model = _model_id(agent.llm)
+    # The whole system prompt, so edits to UNIVERSAL_PROMPT also invalidate entries
+    prompt = f"{agent.UNIVERSAL_PROMPT}\n\n{agent.schema_prompt}"
+    key = cache_key(agent.section_name, prompt, model, measure_name, context)
+    # One semantic partition per agent prompt and model
+    namespace = cache_key(agent.section_name, prompt, model, "", "")
+    return key, namespace
+
+
+def get_cached(agent, measure_name: str, context: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached section for an agent request.
+
+    Args:
+        agent: BaseMobilityAgent issuing the request
+        measure_name: Name of mobility measure
+        context: Additional context
+
+    Returns:
+        Copy of the cached section, or None on a miss (or when disabled)
+    """
+    if settings.CACHE_DISABLE:
+        return None
+
+    key, namespace = _keys(agent, measure_name, context)
+
+    try:
+        cached = _lookup(key)
+    except Exception as e:
+        logger.warning(f"[{agent.section_name}] Cache lookup failed: {e}")
+        cached = None
+
+    if cached is None:
+        try:
+            semantic = _get_semantic_cache()
+            cached = semantic.get(namespace, f"{measure_name}\n{context}") if semantic else None
+            if cached is not None:
+                logger.info(f"[{agent.section_name}] Semantic cache hit")
+                _remember(key, cached)
+        except Exception as e:
+            logger.warning(f"[{agent.section_name}] Semantic cache lookup failed: {e}")
+            cached = None
+
+    if cached is None:
+        return None
+
+    logger.info(f"[{agent.section_name}] ✓ Section served from cache")
+    # Callers may mutate the section (e.g. meta images), so hand out a copy
+    return copy.deepcopy(cached)
+
+
+def store_cached(agent, measure_name: str, context: str, result: Dict[str, Any]) -> None:
+    """
+    Store a successfully generated section for an agent request.
+
+    Args:
+        agent: BaseMobilityAgent that produced the section
+        measure_name: Name of mobility measure
+        context: Additional context
+        result: Generated section
+    """
+    if settings.CACHE_DISABLE or not result:
+        return
+
+    key, namespace = _keys(agent, measure_name, context)
+
+    try:
+        _remember(key, copy.deepcopy(result))
+        _get_disk_cache().set(key, result)
+
+        semantic = _get_semantic_cache()
+        if semantic:
+            semantic.set(namespace, f"{measure_name}\n{context}", result)
+    except Exception as e:
+        logger.warning(f"[{agent.section_name}] Cache store failed: {e}")
+
+
+def cached_generate(generate):
+    """
+    Decorate BaseMobilityAgent.generate with the completion cache.
+
+    Cache hits return AgentResult(result, None) without touching the network.
+    Only successful, non-empty results are stored. Cache failures are logged
+    and never prevent a generation.
+    """
+    @functools.wraps(generate)
+    def wrapper(self, measure_name: str, context: str = "") -> AgentResult:
+        cached = get_cached(self, measure_name, context)
+        if cached is not None:
+            return AgentResult(cached, None)
+
+        result, error = generate(self, measure_name, context)
+
+        if not error:
+            store_cached(self, measure_name, context, result)
+
+        return AgentResult(result, error)
+
+    return wrapper
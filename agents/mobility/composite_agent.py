@@ -0,0 +1,144 @@
+"""
+Composite Agent - Generates several sections in a single LLM call.
+
+Concatenates the schemas of a group of section agents into one prompt and
+splits the returned JSON back into the per-section state keys. This pays the
+prompt-processing and network round-trip cost once per group instead of once
+per section.
+"""
+
+from agents.mobility.base import BaseMobilityAgent
+from agents.mobility.all_agents import (
+    EvidenceAgent,
+    ImpactAgent,
+    RequirementsAgent,
+    InfrastructureAgent,
+    OperationsAgent,
+    CostsAgent,
+    RisksAgent,
+    MonitoringAgent,
+    ChecklistAgent,
+    LifecycleAgent,
+    RolesAgent,
+    FinancialAgent,
+    ComplianceAgent,
+    VisibilityAgent,
+    SelectionAgent,
+    ScalabilityAgent,
+)
+from config.llm import get_llm
+from config.settings import settings
+from schemas.mobility_measure import MobilityResearchState
+
+
+# Sections 4-19 in groups of 4: (state key, agent class)
+# Four sections per call keeps the combined output within the token limit.
+COMPOSITE_GROUPS = (
+    (
+        ("evidence", EvidenceAgent),
+        ("impact", ImpactAgent),
+        ("requirements", RequirementsAgent),
+        ("infrastructure", InfrastructureAgent),
+    ),
+    (
+        ("operations", OperationsAgent),
+        ("costs", CostsAgent),
+        ("risks", RisksAgent),
+        ("monitoring", MonitoringAgent),
+    ),
+    (
+        ("checklist", ChecklistAgent),
+        ("lifecycle", LifecycleAgent),
+        ("roles_responsibilities_detailed", RolesAgent),
+        ("financial_model", FinancialAgent),
+    ),
+    (
+        ("compliance", ComplianceAgent),
+        ("visibility_and_communication_design", VisibilityAgent),
+        ("selection_logic", SelectionAgent),
+        ("future_scalability", ScalabilityAgent),
+    ),
+)
+
+# Sections 4-19 as one group (SINGLE_CALL_MODE)
+ALL_SECTIONS_GROUP = tuple(member for group in COMPOSITE_GROUPS for member in group)
+
+
+class CompositeAgent(BaseMobilityAgent):
+    """Generates a group of sections as one JSON object keyed by state key."""
+
+    def __init__(self, members, llm_instance=None):
+        """
+        Initialize the composite agent.
+
+        Args:
+            members: Tuple of (state_key, agent_class) pairs to generate together
+            llm_instance: Optional specific LLM instance to use
+        """
+        self.members = members
+
+        default_llm = get_llm()
+        if llm_instance is None and default_llm is not None:
+            # Room for every section's output in one response
+            llm_instance = default_llm.model_copy(
+                update={"max_tokens": settings.MAX_TOKENS * len(members)}
+            )
+
+        section_name = "+".join(key for key, _ in members)
+        super().__init__(section_name, self._build_schema_prompt(members), llm_instance)
+
+    @staticmethod
+    def _build_schema_prompt(members) -> str:
+        """Concatenate member schemas under their output keys."""
+        keys = ", ".join(f'"{key}"' for key, _ in members)
+        parts = [
+            f"Generate a single JSON object with exactly these top-level keys: {keys}.\n"
+            "The value of each key is the section described by the schema and rules "
+            "under its heading below. Do not wrap sections in any other keys."
+        ]
+
+        for key, agent_cls in members:
+            parts.append(f'### "{key}"\n\n{agent_cls.SCHEMA_PROMPT}')
+
+        return "\n\n".join(parts)
+
+    def split(self, result: dict) -> dict:
+        """
+        Split a composite result into per-section state updates.
+
+        Args:
+            result: Parsed composite JSON
+
+        Returns:
+            Dict of state_key -> section dict (empty when missing)
+        """
+        return {
+            key: result.get(key) if isinstance(result.get(key), dict) else {}
+            for key, _ in self.members
+        }
+
+
+def make_composite_node(members):
+    """
+    Create a LangGraph node that generates a group of sections in one call.
+
+    Args:
+        members: Tuple of (state_key, agent_class) pairs
+
+    Returns:
+        Async node function returning the sections and any errors
+    """
+    agent = CompositeAgent(members)
+
+    async def composite_agent_node(state: MobilityResearchState) -> dict:
+        result, error = await agent.agenerate(state["measure_name"], state.get("context", ""))
+        sections = agent.split(result or {})
+
+        errors = [error] if error else []
+        missing = [key for key, value in sections.items() if not value]
+        if missing and not error:
+            errors.append(f"Composite response missing sections: {', '.join(missing)}")
+
+        return {**sections, "errors": errors}
+
+    return composite_agent_node
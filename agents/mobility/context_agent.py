@@ -2,38 +2,25 @@
 
 from agents.mobility.base import BaseMobilityAgent
 from schemas.mobility_measure import MobilityResearchState
-from config.llm import groq_llm
+from schemas.prompts import PROMPTS
 
 
 class ContextAgent(BaseMobilityAgent):
     """Generates the context section of a mobility measure."""
     
-    SCHEMA_PROMPT = '''Generate ONLY the "context" section:
-
-{
-  "target_users": [],
-  "suitable_strong": [],
-  "suitable_weak": []
-}
+    SCHEMA_PROMPT = PROMPTS["context"]
+    
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("context", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
-For each suitability item, describe conditions precisely.
-Avoid vague labels like "urban" alone.
-Focus on specific situational characteristics: density, land-use patterns, cycling culture, street design, and public transport integration.
 
-Rules:
-- target_users = specific user groups with meaningful descriptors
-- suitable_strong = describe WHERE and WHY this measure works well (8-15 words per item)
-- suitable_weak = describe conditions that limit effectiveness with reasoning (8-15 words per item)'''
-    
-    def __init__(self, llm_instance=None):
-        super().__init__("context", self.SCHEMA_PROMPT, llm_instance)
+# Context: small tier (Simple Lists)
+_AGENT = ContextAgent(model_tier="small")
 
 
-def context_agent_node(state: MobilityResearchState) -> dict:
+async def context_agent_node(state: MobilityResearchState) -> dict:
     """LangGraph node function for context agent."""
-    # Context: Groq (Simple Lists)
-    agent = ContextAgent(llm_instance=groq_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
+    result, error = await _AGENT.agenerate(state["measure_name"], state.get("context", ""))
     
     if error:
         return {"context_data": {}, "errors": [error]}
@@ -0,0 +1,82 @@
+"""Result and error types for section generation."""
+
+from enum import Enum
+from typing import Any, Dict, NamedTuple, Optional
+import anthropic
+import groq
+import httpx
+
+
+class ErrorCode(str, Enum):
+    """Why a section could not be generated."""
+
+    RATE_LIMIT = "rate_limit"
+    AUTH = "auth"
+    PARSE = "parse"
+    NETWORK = "network"
+    UNKNOWN = "unknown"
+
+
+class AgentError(str):
+    """
+    Error message returned by agents, tagged with an ErrorCode.
+
+    Subclasses str so it can still be logged, joined and collected in the
+    graph's errors list like a plain message, while callers that need to
+    branch on the failure type read .code instead of parsing the text.
+    """
+
+    code: ErrorCode
+
+    def __new__(cls, message: str, code: ErrorCode = ErrorCode.UNKNOWN):
+        error = super().__new__(cls, message)
+        error.code = code
+        return error
+
+
+class AgentResult(NamedTuple):
+    """
+    Outcome of one section generation.
+
+    A tuple, so existing `result, error = agent.generate(...)` unpacking keeps
+    working; new code can read .data / .error instead.
+    """
+
+    data: Dict[str, Any]
+    error: Optional[AgentError] = None
+
+
+_RATE_LIMIT_ERRORS = (groq.RateLimitError, anthropic.RateLimitError)
+_AUTH_ERRORS = (
+    groq.AuthenticationError,
+    groq.PermissionDeniedError,
+    anthropic.AuthenticationError,
+    anthropic.PermissionDeniedError,
+)
+# Includes the SDKs' APITimeoutError subclasses
+_NETWORK_ERRORS = (groq.APIConnectionError, anthropic.APIConnectionError, httpx.TransportError)
+
+
+def classify_error(error: Exception) -> ErrorCode:
+    """
+    Map an exception raised by an LLM call to an ErrorCode.
+
+    Args:
+        error: Exception from invoke/stream
+
+    Returns:
+        Matching ErrorCode (UNKNOWN if unrecognized)
+    """
+    if isinstance(error, _RATE_LIMIT_ERRORS):
+        return ErrorCode.RATE_LIMIT
+    if isinstance(error, _AUTH_ERRORS):
+        return ErrorCode.AUTH
+    if isinstance(error, _NETWORK_ERRORS):
+        return ErrorCode.NETWORK
+
+    # Errors re-raised or wrapped by other layers only keep the message
+    error_str = str(error)
+    if "429" in error_str or "rate_limit" in error_str.lower():
+        return ErrorCode.RATE_LIMIT
+
+    return ErrorCode.UNKNOWN
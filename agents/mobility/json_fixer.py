@@ -1,10 +1,88 @@
 """JSON Fixer Agent - specialized in repairing malformed JSON."""
 
+import re
+import time
 from typing import Dict, Any, Optional, Tuple
 from langchain_core.messages import SystemMessage, HumanMessage
-from config.llm import llm
+from config.llm import get_llm
 from utils.logger import logger
-from utils.json_utils import extract_json_from_text, safe_json_parse
+from utils.json_utils import extract_json_from_text, loads_json, safe_json_parse
+
+
+# "Please try again in 1.5s" / "try again in 250ms" hint in 429 messages
+_WAIT_RE = re.compile(r'try again in ([\d.]+)(ms|s)')
+
+
+def _parse_retry_after(error_str: str) -> Optional[float]:
+    """Seconds a 429 message asks us to wait, or None if it gives no hint."""
+    wait_match = _WAIT_RE.search(error_str)
+    if not wait_match:
+        return None
+    
+    wait_value = float(wait_match.group(1))
+    return wait_value if wait_match.group(2) == 's' else wait_value / 1000
+
+
+# Markdown fences left around (or inside) the JSON
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.M)
+# Comma directly before a closing brace/bracket
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+
+def _close_open_brackets(text: str) -> str:
+    """Append the quote/brackets needed to close truncated JSON."""
+    closers = []
+    in_string = False
+    escaped = False
+    
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]" and closers:
+            closers.pop()
+    
+    return text + ('"' if in_string else "") + "".join(reversed(closers))
+
+
+def _local_repair(broken_json: str) -> Optional[Dict[str, Any]]:
+    """
+    Try cheap local fixes before asking the LLM.
+    
+    Applies, in order: stripping markdown fences, removing trailing commas,
+    and closing unbalanced strings/braces/brackets (truncated output).
+    
+    Args:
+        broken_json: The malformed JSON string
+        
+    Returns:
+        The parsed dict if one of the fixes worked, otherwise None
+    """
+    text = _FENCE_RE.sub("", broken_json.strip())
+    
+    for repair in (
+        lambda s: s,
+        lambda s: _TRAILING_COMMA_RE.sub(r'\1', s),
+        lambda s: _TRAILING_COMMA_RE.sub(r'\1', _close_open_brackets(s.rstrip().rstrip(","))),
+    ):
+        text = repair(text)
+        try:
+            parsed = loads_json(text)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    
+    return None
+
 
 class JsonFixerAgent:
     """
@@ -26,9 +104,13 @@ class JsonFixerAgent:
     - Fix syntax errors (missing commas, unclosed quotes/braces).
     - Ensure all keys and string values are properly double-quoted.
     """
+    
+    # Built once and shared by every repair request (identical prompt prefix)
+    SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
 
     def __init__(self):
-        self.llm = llm
+        # Resolved on the first LLM repair; most repairs are done locally
+        self.llm = None
 
     def fix_json(self, broken_json: str, error_msg: str, context_prompt: str = "") -> Tuple[Dict[str, Any], Optional[str]]:
         """
@@ -44,6 +126,12 @@ class JsonFixerAgent:
             If success: (dict, None)
             If failure: ({}, error_msg)
         """
+        # Trivial breakage (fences, trailing commas, truncation) needs no LLM call
+        repaired = _local_repair(broken_json)
+        if repaired is not None:
+            logger.info("🔧 JSON FIXER: Repaired JSON locally")
+            return repaired, None
+        
         logger.info("🔧 JSON FIXER: Attempting to repair malformed JSON...")
         
         # Construct a targeted prompt for the fix
@@ -60,20 +148,16 @@ EXPECTED SCHEMA/CONTEXT:
 Please fix the JSON errors and return the valid JSON object.
 """
         
+        # We use the same LLM instance
+        if self.llm is None:
+            self.llm = get_llm()
+        messages = [self.SYSTEM_MESSAGE, HumanMessage(content=fix_prompt)]
+        
         # Retry logic for rate limits
         max_retries = 3
         
-        import time
-        import re
-        
         for attempt in range(max_retries + 1):
             try:
-                # We use the same LLM instance
-                messages = [
-                    SystemMessage(content=self.SYSTEM_PROMPT),
-                    HumanMessage(content=fix_prompt)
-                ]
-                
                 response = self.llm.invoke(messages)
                 content = response.content
                 
@@ -96,12 +180,8 @@ Please fix the JSON errors and return the valid JSON object.
                 if "429" in error_str or "rate_limit" in error_str.lower():
                     if attempt < max_retries:
                         # Extract wait time or default to exponential backoff
-                        wait_match = re.search(r'try again in ([\d.]+)([ms])', error_str)
-                        if wait_match:
-                            wait_value = float(wait_match.group(1))
-                            wait_unit = wait_match.group(2)
-                            wait_time = wait_value if wait_unit == 's' else wait_value / 1000
-                        else:
+                        wait_time = _parse_retry_after(error_str)
+                        if wait_time is None:
                             wait_time = 2 * (2 ** attempt)  # 2, 4, 8 seconds
                             
                         wait_time = min(wait_time, 15.0)
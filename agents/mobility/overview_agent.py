@@ -2,38 +2,25 @@
 
 from agents.mobility.base import BaseMobilityAgent
 from schemas.mobility_measure import MobilityResearchState
-from config.llm import anthropic_llm
+from schemas.prompts import PROMPTS
 
 
 class OverviewAgent(BaseMobilityAgent):
     """Generates the overview section of a mobility measure."""
     
-    SCHEMA_PROMPT = '''Generate ONLY the "overview" section:
-
-{
-  "description": "",
-  "behavioural_primary": "",
-  "behavioural_secondary": []
-}
+    SCHEMA_PROMPT = PROMPTS["overview"]
+    
+    def __init__(self, llm_instance=None, model_tier=None):
+        super().__init__("overview", self.SCHEMA_PROMPT, llm_instance, model_tier)
 
-Your content must provide meaningful explanation, not generic statements.
-Describe what the mobility measure fundamentally is, how it works, and why it matters.
-The behavioural fields must describe real behavioural dynamics, not vague goals.
 
-Rules:
-- description = 2–3 sentences providing substantive explanation of what this measure is and how it functions
-- behavioural_primary = describe the main behavioural change this measure aims to influence and why
-- behavioural_secondary = 2–4 supporting behavioural patterns, each explained clearly'''
-    
-    def __init__(self, llm_instance=None):
-        super().__init__("overview", self.SCHEMA_PROMPT, llm_instance)
+# Overview: large tier (High Quality Description)
+_AGENT = OverviewAgent(model_tier="large")
 
 
-def overview_agent_node(state: MobilityResearchState) -> dict:
+async def overview_agent_node(state: MobilityResearchState) -> dict:
     """LangGraph node function for overview agent."""
-    # Overview: Anthropic (High Quality Description)
-    agent = OverviewAgent(llm_instance=anthropic_llm)
-    result, error = agent.generate(state["measure_name"], state.get("context", ""))
+    result, error = await _AGENT.agenerate(state["measure_name"], state.get("context", ""))
     
     if error:
         return {"overview": {}, "errors": [error]}
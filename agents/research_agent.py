@@ -2,7 +2,7 @@
 
 from typing import TypedDict, Annotated
 from langchain_core.messages import HumanMessage, SystemMessage
-from config.llm import llm
+from config.llm import get_llm
 from utils.logger import logger
 import operator
 
@@ -37,7 +37,7 @@ def analyze_query_node(state: ResearchState) -> ResearchState:
         HumanMessage(content=f"Query: {state['query']}\n\nWhat are the key aspects to research?")
     ]
     
-    response = llm.invoke(messages)
+    response = get_llm().invoke(messages)
     
     return {
         **state,
@@ -70,7 +70,7 @@ def research_node(state: ResearchState) -> ResearchState:
         ))
     ]
     
-    response = llm.invoke(messages)
+    response = get_llm().invoke(messages)
     
     return {
         **state,
@@ -104,7 +104,7 @@ def synthesize_node(state: ResearchState) -> ResearchState:
         ))
     ]
     
-    response = llm.invoke(messages)
+    response = get_llm().invoke(messages)
     answer = response.content.strip()
     
     logger.info("Synthesis complete!")
@@ -0,0 +1,19 @@
+"""Environment bootstrap for the command-line entry points."""
+
+import os
+from dotenv import load_dotenv
+
+
+def load_env() -> None:
+    """
+    Load the .env file into os.environ once per process tree.
+    
+    Entry points call this before importing anything that reads the
+    environment (settings, provider SDKs), so every import sees the values.
+    Existing environment variables win over .env entries.
+    """
+    if os.environ.get("_DOTENV_LOADED"):
+        return
+    
+    load_dotenv(override=False)
+    os.environ["_DOTENV_LOADED"] = "1"
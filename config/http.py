@@ -0,0 +1,32 @@
+"""Shared HTTP transport for LLM clients."""
+
+import functools
+import importlib.util
+
+import httpx
+
+
+# One pool for every agent: 16 concurrent sections reuse warm TLS connections
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# HTTP/2 multiplexes concurrent calls over one connection; needs the h2 package
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+_limits = httpx.Limits(
+    max_connections=MAX_CONNECTIONS,
+    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+)
+
+
+@functools.cache
+def get_http_client() -> httpx.Client:
+    """Get the process-wide sync client (created on first use, then shared)."""
+    return httpx.Client(http2=HTTP2, limits=_limits, timeout=TIMEOUT)
+
+
+@functools.cache
+def get_http_async_client() -> httpx.AsyncClient:
+    """Get the process-wide async client (created on first use, then shared)."""
+    return httpx.AsyncClient(http2=HTTP2, limits=_limits, timeout=TIMEOUT)
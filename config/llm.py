@@ -1,23 +1,49 @@
 """Groq LLM initialization and configuration."""
 
-from langchain_groq import ChatGroq
-from config.settings import settings
+import functools
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from config.http import get_http_client, get_http_async_client
+from config.settings import get_settings
+from utils.admission import AdmissionController
 
 
-def get_groq_llm():
-    """Get Groq LLM instance."""
+settings = get_settings()
+
+# Shared across every Groq model so the limit applies to the whole process
+RATE_LIMITER = (
+    InMemoryRateLimiter(requests_per_second=settings.GROQ_RPS, check_every_n_seconds=0.05)
+    if settings.ENABLE_RATE_LIMITING else None
+)
+
+
+@functools.lru_cache(maxsize=4)
+def get_groq_llm(model: str = None):
+    """Get Groq LLM instance (one per model, on the shared pooled HTTP clients and rate limiter)."""
+    settings = get_settings()
     if not settings.GROQ_API_KEY:
         return None
-        
+    
+    from langchain_groq import ChatGroq
     return ChatGroq(
         api_key=settings.GROQ_API_KEY,
-        model=settings.MODEL_NAME,
+        model=model or settings.MODEL_NAME,
         temperature=settings.TEMPERATURE,
         max_tokens=settings.MAX_TOKENS,
+        http_client=get_http_client(),
+        http_async_client=get_http_async_client(),
+        rate_limiter=RATE_LIMITER,
     )
 
+@functools.cache
+def get_fallback_llm():
+    """Get the Groq FALLBACK_MODEL instance used after 429s (built once, then reused)."""
+    settings = get_settings()
+    return get_groq_llm(settings.FALLBACK_MODEL)
+
+@functools.cache
 def get_anthropic_llm():
     """Get Anthropic LLM instance."""
+    settings = get_settings()
     if not settings.ANTHROPIC_API_KEY:
         return None
         
@@ -29,18 +55,50 @@ def get_anthropic_llm():
         max_tokens=settings.MAX_TOKENS,
     )
 
+def supports_prompt_caching(llm_instance) -> bool:
+    """
+    Check whether an LLM accepts explicit prompt-cache breakpoints.
+    
+    Anthropic requires cache_control markers on the static prefix; Groq and
+    OpenAI-compatible models cache repeated prefixes automatically. Checked by
+    module name so Groq-only runs never import langchain_anthropic.
+    """
+    if llm_instance is None:
+        return False
+    
+    return type(llm_instance).__module__.startswith("langchain_anthropic")
+
+@functools.cache
 def get_llm():
     """
     Get default LLM based on settings.
     Returns Anthropic if MONEY_MODE is True, else Groq.
+    
+    Built on first call, so importing this module does not load a provider
+    SDK; call get_llm.cache_clear() after changing MONEY_MODE in tests.
+    Agents and graph nodes must get their client here (or via
+    get_llm_for_tier) rather than constructing one, so every call shares
+    the same connection pool.
     """
+    settings = get_settings()
     if settings.MONEY_MODE and settings.ANTHROPIC_API_KEY:
         return get_anthropic_llm()
     return get_groq_llm()
 
-# Initialize instances
-groq_llm = get_groq_llm()
-anthropic_llm = get_anthropic_llm()
+# Shared admission control for every outbound LLM call
+llm_admission = AdmissionController(
+    settings.LLM_MAX_CONCURRENCY,
+    settings.LLM_TOKENS_PER_MINUTE,
+)
+
 
-# Default LLM (legacy support and default behavior)
-llm = get_llm()
+def get_llm_for_tier(tier: str):
+    """
+    Get the LLM for a model tier.
+    
+    "small" routes to the fast, cheap Groq model for short list-style sections;
+    "large" routes to Anthropic for nested, reasoning-heavy sections. Falls back
+    to the default LLM when the tier's provider is not configured.
+    """
+    tier_llm = {"small": get_groq_llm, "large": get_anthropic_llm}.get(tier, get_llm)()
+    return tier_llm if tier_llm is not None else get_llm()
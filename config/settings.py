@@ -1,46 +1,90 @@
 """Global configuration settings for the LangGraph research agent project."""
 
+import functools
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
-# Load environment variables from .env file
-load_dotenv()
+__all__ = ("Settings", "get_settings", "settings")
 
+# .env is loaded by the entry points (config.env.load_env) before this import
 
+
+def _flag(value: str) -> bool:
+    """Parse a "true"/"false" environment value."""
+    return value.lower() == "true"
+
+
+def _env(key: str, default: str, cast: Callable[[str], Any] = str):
+    """Dataclass field read from the environment once, when Settings is built."""
+    return field(default_factory=lambda: cast(os.getenv(key, default)))
+
+
+@dataclass(frozen=True, slots=True, repr=False)
 class Settings:
-    """Application settings loaded from environment variables."""
+    """Application settings loaded from environment variables (read-only)."""
     
     # Groq API Configuration
-    GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
-    PEXELS_API_KEY: str = os.getenv("PEXELS_API_KEY", "")
+    GROQ_API_KEY: str = _env("GROQ_API_KEY", "")
+    PEXELS_API_KEY: str = _env("PEXELS_API_KEY", "")
     
     # Anthropic API Configuration (Money Mode)
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
-    MONEY_MODE: bool = os.getenv("MONEY_MODE", "false").lower() == "true"
+    ANTHROPIC_API_KEY: str = _env("ANTHROPIC_API_KEY", "")
+    MONEY_MODE: bool = _env("MONEY_MODE", "false", _flag)
     
     # LLM Configuration
     # Groq models (free tier with rate limits)
-    MODEL_NAME: str = os.getenv("MODEL_NAME", "openai/gpt-oss-120b")
-    FALLBACK_MODEL: str = os.getenv("FALLBACK_MODEL", "llama-3.3-70b-versatile")
+    MODEL_NAME: str = _env("MODEL_NAME", "openai/gpt-oss-120b")
+    FALLBACK_MODEL: str = _env("FALLBACK_MODEL", "llama-3.3-70b-versatile")
     
     # Anthropic Claude models (money mode - no rate limits)
-    CLAUDE_MODEL: str = os.getenv("CLAUDE_MODEL", "claude-haiku-4-5-20251001")
+    CLAUDE_MODEL: str = _env("CLAUDE_MODEL", "claude-haiku-4-5-20251001")
+    
+    TEMPERATURE: float = _env("TEMPERATURE", "0.7", float)
+    MAX_TOKENS: int = _env("MAX_TOKENS", "2048", int)
+    # Output token budget for one batched multi-measure call (caps batch size)
+    BATCH_MAX_TOKENS: int = _env("BATCH_MAX_TOKENS", "16384", int)
+    # Request sections via provider tool/function calling with the section schema
+    STRUCTURED_OUTPUT: bool = _env("STRUCTURED_OUTPUT", "true", _flag)
     
-    TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
-    MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "2048"))
+    # Anthropic prompt cache TTL for the shared UNIVERSAL_PROMPT block ("5m" or "1h")
+    PROMPT_CACHE_TTL: str = _env("PROMPT_CACHE_TTL", "1h")
     
     # Rate Limiting Configuration
-    # Delays are in seconds, help prevent hitting API rate limits
-    # With 19 parallel agents, need enough spread to stay under TPM limits
-    REQUEST_DELAY_MIN: float = float(os.getenv("REQUEST_DELAY_MIN", "2.0"))
-    REQUEST_DELAY_MAX: float = float(os.getenv("REQUEST_DELAY_MAX", "5.0"))
-    ENABLE_RATE_LIMITING: bool = os.getenv("ENABLE_RATE_LIMITING", "true").lower() == "true"
+    # Groq requests are spaced by a shared token bucket; calls only wait when
+    # they would exceed GROQ_RPS
+    GROQ_RPS: float = _env("GROQ_RPS", "2.0", float)
+    ENABLE_RATE_LIMITING: bool = _env("ENABLE_RATE_LIMITING", "true", _flag)
+    # 429s are retried with exponential backoff + jitter before the fallback model is tried
+    RATE_LIMIT_RETRIES: int = _env("RATE_LIMIT_RETRIES", "3", int)
+    RATE_LIMIT_BACKOFF_INITIAL: float = _env("RATE_LIMIT_BACKOFF_INITIAL", "0.5", float)
+    RATE_LIMIT_BACKOFF_MAX: float = _env("RATE_LIMIT_BACKOFF_MAX", "8.0", float)
+    
+    # Admission Control (queues LLM calls locally instead of bursting into 429s)
+    LLM_MAX_CONCURRENCY: int = _env("LLM_MAX_CONCURRENCY", "8", int)
+    LLM_TOKENS_PER_MINUTE: int = _env("LLM_TOKENS_PER_MINUTE", "0", int)  # 0 = unlimited
+    
+    # Completion Cache
+    # Repeat requests for the same measure/context are served from disk
+    CACHE_DISABLE: bool = _env("CACHE_DISABLE", "false", _flag)
+    CACHE_DIR: str = _env("CACHE_DIR", ".cache")
+    CACHE_TTL_SECONDS: float = _env("CACHE_TTL_SECONDS", str(7 * 24 * 3600), float)
+    # Serve near-duplicate measure/context requests (requires sentence-transformers)
+    SEMANTIC_CACHE_ENABLE: bool = _env("SEMANTIC_CACHE_ENABLE", "false", _flag)
+    SEMANTIC_CACHE_THRESHOLD: float = _env("SEMANTIC_CACHE_THRESHOLD", "0.95", float)
+    SEMANTIC_CACHE_MODEL: str = _env("SEMANTIC_CACHE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+    # Pexels image search results per measure name
+    IMAGE_CACHE_TTL_SECONDS: float = _env("IMAGE_CACHE_TTL_SECONDS", str(24 * 3600), float)
     
     # Execution Mode
-    SEQUENTIAL_MODE: bool = os.getenv("SEQUENTIAL_MODE", "false").lower() == "true"
+    SEQUENTIAL_MODE: bool = _env("SEQUENTIAL_MODE", "false", _flag)
+    # Generate sections 4-19 in 4 grouped LLM calls instead of 16
+    COMPOSITE_MODE: bool = _env("COMPOSITE_MODE", "false", _flag)
+    # Generate sections 4-19 in a single LLM call (takes precedence over COMPOSITE_MODE)
+    SINGLE_CALL_MODE: bool = _env("SINGLE_CALL_MODE", "false", _flag)
     
     # Application Configuration
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    DEBUG: bool = _env("DEBUG", "false", _flag)
     
     def validate(self) -> None:
         """Validate that required API keys are set."""
@@ -70,5 +114,15 @@ class Settings:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings, built on first call.
+    
+    Tests that change the environment can call get_settings.cache_clear().
+    """
+    return Settings()
+
+
 # Singleton instance
-settings = Settings()
+settings = get_settings()
@@ -5,9 +5,12 @@ This shows how to use the research agent programmatically and get
 structured JSON output with question, answer, and timestamp.
 """
 
+from config.env import load_env
+load_env()
+
 from graphs.research_graph import research_graph
-from utils.formatting import format_research_output
-import json
+from utils.formatting import BAR60, format_research_output
+from utils.json_utils import loads_json
 
 
 def run_example():
@@ -34,21 +37,21 @@ def run_example():
     # Format as JSON
     json_output = format_research_output(result)
     
-    print("=" * 60)
+    print(BAR60)
     print("STRUCTURED JSON OUTPUT:")
-    print("=" * 60)
+    print(BAR60)
     print(json_output)
     print("\n")
     
     # Parse and display structure
-    parsed = json.loads(json_output)
-    print("=" * 60)
+    parsed = loads_json(json_output)
+    print(BAR60)
     print("OUTPUT STRUCTURE:")
-    print("=" * 60)
+    print(BAR60)
     print(f"✓ question: string ({len(parsed['question'])} chars)")
     print(f"✓ answer: string ({len(parsed['answer'])} chars)")
     print(f"✓ time_date: ISO 8601 timestamp")
-    print("=" * 60)
+    print(BAR60)
 
 
 if __name__ == "__main__":
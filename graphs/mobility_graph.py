@@ -5,39 +5,86 @@ This graph coordinates execution of all 19 specialized agents in parallel,
 then combines their outputs into a complete mobility measure JSON document.
 """
 
+import functools
+import importlib
+
 from langgraph.graph import StateGraph, START, END
 from schemas.mobility_measure import MobilityResearchState
-from agents.mobility.meta_agent import meta_agent_node
-from agents.mobility.overview_agent import overview_agent_node
-from agents.mobility.context_agent import context_agent_node
-from agents.mobility.all_agents import (
-    evidence_agent_node,
-    impact_agent_node,
-    requirements_agent_node,
-    infrastructure_agent_node,
-    operations_agent_node,
-    costs_agent_node,
-    risks_agent_node,
-    monitoring_agent_node,
-    checklist_agent_node,
-    lifecycle_agent_node,
-    roles_agent_node,
-    financial_agent_node,
-    compliance_agent_node,
-    visibility_agent_node,
-    selection_agent_node,
-    scalability_agent_node,
-)
-from agents.mobility.assembly_agent import assembly_agent_node
+from config.settings import settings
 from utils.logger import logger
 
 
+def _lazy(module: str, name: str, is_async: bool = True):
+    """
+    Create a node that imports its implementation on first call.
+    
+    Agent modules pull in LangChain and the provider SDKs, so importing them
+    is deferred until the graph actually runs.
+    
+    Args:
+        module: Module defining the node function
+        name: Node function name
+        is_async: Whether the node function is a coroutine function
+        
+    Returns:
+        Node function with the same sync/async kind as the target
+    """
+    @functools.cache
+    def resolve():
+        return getattr(importlib.import_module(module), name)
+    
+    if is_async:
+        async def node(state: MobilityResearchState) -> dict:
+            return await resolve()(state)
+    else:
+        def node(state: MobilityResearchState) -> dict:
+            return resolve()(state)
+    
+    node.__name__ = name
+    return node
+
+
+_ALL_AGENTS = "agents.mobility.all_agents"
+
+# Section agent nodes, in document order
+AGENT_NODES = {
+    "meta_agent": _lazy("agents.mobility.meta_agent", "meta_agent_node"),
+    "overview_agent": _lazy("agents.mobility.overview_agent", "overview_agent_node"),
+    "context_agent": _lazy("agents.mobility.context_agent", "context_agent_node"),
+    "evidence_agent": _lazy(_ALL_AGENTS, "evidence_agent_node"),
+    "impact_agent": _lazy(_ALL_AGENTS, "impact_agent_node"),
+    "requirements_agent": _lazy(_ALL_AGENTS, "requirements_agent_node"),
+    "infrastructure_agent": _lazy(_ALL_AGENTS, "infrastructure_agent_node"),
+    "operations_agent": _lazy(_ALL_AGENTS, "operations_agent_node"),
+    "costs_agent": _lazy(_ALL_AGENTS, "costs_agent_node"),
+    "risks_agent": _lazy(_ALL_AGENTS, "risks_agent_node"),
+    "monitoring_agent": _lazy(_ALL_AGENTS, "monitoring_agent_node"),
+    "checklist_agent": _lazy(_ALL_AGENTS, "checklist_agent_node"),
+    "lifecycle_agent": _lazy(_ALL_AGENTS, "lifecycle_agent_node"),
+    "roles_agent": _lazy(_ALL_AGENTS, "roles_agent_node"),
+    "financial_agent": _lazy(_ALL_AGENTS, "financial_agent_node"),
+    "compliance_agent": _lazy(_ALL_AGENTS, "compliance_agent_node"),
+    "visibility_agent": _lazy(_ALL_AGENTS, "visibility_agent_node"),
+    "selection_agent": _lazy(_ALL_AGENTS, "selection_agent_node"),
+    "scalability_agent": _lazy(_ALL_AGENTS, "scalability_agent_node"),
+}
+AGENT_NAMES = tuple(AGENT_NODES)
+# Sections 1-3 always run as their own agents
+CORE_AGENT_NAMES = AGENT_NAMES[:3]
+
+
+@functools.lru_cache(maxsize=1)
 def create_mobility_graph():
     """
     Create and compile the multi-agent mobility research workflow.
     
+    Compiled once per process; later calls return the same graph.
+    
     Architecture:
-    - All 19 agents execute in parallel from START
+    - All 19 agents execute in parallel from START (async nodes are awaited
+      concurrently when the graph is run with ainvoke)
+    - With COMPOSITE_MODE, sections 4-19 are generated in 4 grouped calls;
+      with SINGLE_CALL_MODE, in one call
     - All agents feed their outputs to assembly_agent
     - Assembly validates, merges, and saves complete JSON
     - Workflow ends at END
@@ -50,45 +97,27 @@ def create_mobility_graph():
     # Create workflow with MobilityResearchState schema
     workflow = StateGraph(MobilityResearchState)
     
-    # Add all 19 specialized agent nodes
-    workflow.add_node("meta_agent", meta_agent_node)
-    workflow.add_node("overview_agent", overview_agent_node)
-    workflow.add_node("context_agent", context_agent_node)
-    workflow.add_node("evidence_agent", evidence_agent_node)
-    workflow.add_node("impact_agent", impact_agent_node)
-    workflow.add_node("requirements_agent", requirements_agent_node)
-    workflow.add_node("infrastructure_agent", infrastructure_agent_node)
-    workflow.add_node("operations_agent", operations_agent_node)
-    workflow.add_node("costs_agent", costs_agent_node)
-    workflow.add_node("risks_agent", risks_agent_node)
-    workflow.add_node("monitoring_agent", monitoring_agent_node)
-    workflow.add_node("checklist_agent", checklist_agent_node)
-    workflow.add_node("lifecycle_agent", lifecycle_agent_node)
-    workflow.add_node("roles_agent", roles_agent_node)
-    workflow.add_node("financial_agent", financial_agent_node)
-    workflow.add_node("compliance_agent", compliance_agent_node)
-    workflow.add_node("visibility_agent", visibility_agent_node)
-    workflow.add_node("selection_agent", selection_agent_node)
-    workflow.add_node("scalability_agent", scalability_agent_node)
+    if settings.SINGLE_CALL_MODE or settings.COMPOSITE_MODE:
+        # Sections 4-19 generated in groups, one LLM call per group
+        from agents.mobility.composite_agent import ALL_SECTIONS_GROUP, COMPOSITE_GROUPS, make_composite_node
+        
+        groups = (ALL_SECTIONS_GROUP,) if settings.SINGLE_CALL_MODE else COMPOSITE_GROUPS
+        nodes = {name: AGENT_NODES[name] for name in CORE_AGENT_NAMES}
+        for index, members in enumerate(groups, start=1):
+            nodes[f"composite_agent_{index}"] = make_composite_node(members)
+    else:
+        nodes = AGENT_NODES
     
     # Add assembly node
-    workflow.add_node("assembly", assembly_agent_node)
+    workflow.add_node("assembly", _lazy("agents.mobility.assembly_agent", "assembly_agent_node", is_async=False))
     
     # All agents execute in parallel from START
-    agent_names = [
-        "meta_agent", "overview_agent", "context_agent", "evidence_agent",
-        "impact_agent", "requirements_agent", "infrastructure_agent",
-        "operations_agent", "costs_agent", "risks_agent", "monitoring_agent",
-        "checklist_agent", "lifecycle_agent", "roles_agent", "financial_agent",
-        "compliance_agent", "visibility_agent", "selection_agent", "scalability_agent"
-    ]
-    
-    for agent_name in agent_names:
+    for agent_name, node in nodes.items():
+        workflow.add_node(agent_name, node)
         workflow.add_edge(START, agent_name)
     
-    # All agents converge to assembly
-    for agent_name in agent_names:
-        workflow.add_edge(agent_name, "assembly")
+    # One fan-in edge: assembly runs once, after every agent has finished
+    workflow.add_edge(list(nodes), "assembly")
     
     # Assembly to END
     workflow.add_edge("assembly", END)
@@ -96,7 +125,7 @@ def create_mobility_graph():
     # Compile the graph
     graph = workflow.compile()
     
-    logger.info(f"✓ Mobility graph compiled with {len(agent_names)} agents")
+    logger.info(f"✓ Mobility graph compiled with {len(nodes)} agent nodes")
     logger.info("✓ Agents will execute in parallel")
     
     return graph
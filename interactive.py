@@ -1,11 +1,29 @@
 """Interactive CLI for the LangGraph research agent."""
 
+from config.env import load_env
+load_env()
+
+import asyncio
 import sys
-from graphs.research_graph import research_graph
-from utils.formatting import format_research_output, validate_research_output, print_header
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from utils.formatting import BAR60, DASH60, format_research_output, validate_research_output, print_header
 from utils.logger import logger
 
 
+# Questions researched at the same time; further ones wait for a free slot
+MAX_CONCURRENT_QUERIES = 3
+
+# Empty graph input; every query copies it and fills in the question
+_INITIAL_STATE_TEMPLATE = MappingProxyType({
+    "summary": "",
+    "key_points": [],
+    "sources_consulted": [],
+    "internal_notes": ""
+})
+
+
 def print_welcome():
     """Print welcome message."""
     print_header("🔬 LangGraph Research Agent - Interactive Mode")
@@ -15,29 +33,36 @@ def print_welcome():
     print("  - Type 'quit', 'exit', or 'q' to exit")
     print("  - Type 'help' for this message")
     print("  - Press Ctrl+C to exit anytime")
-    print("\n" + "=" * 60)
+    print("\n" + BAR60)
 
 
-def run_research(query: str) -> dict:
+async def arun_research(query: str, number: int = None) -> dict:
     """
-    Run the research agent workflow with the given query.
+    Run the research agent workflow with the given query on the event loop.
+    
+    Cancelling the awaiting task stops the run before its next node.
     
     Args:
         query: The research question or topic
+        number: Query number used to label progress lines (concurrent runs)
         
     Returns:
         Dictionary containing the research results
     """
-    initial_state = {
-        "query": query,
-        "summary": "",
-        "key_points": [],
-        "sources_consulted": [],
-        "internal_notes": ""
-    }
+    # Imported here so the welcome text and commands don't wait on the LLM stack
+    from graphs.research_graph import research_graph
+    
+    initial_state = {**_INITIAL_STATE_TEMPLATE, "query": query}
+    label = f"[#{number}] " if number is not None else ""
     
     try:
-        final_state = research_graph.invoke(initial_state)
+        final_state = initial_state
+        async for mode, chunk in research_graph.astream(initial_state, stream_mode=["updates", "values"]):
+            if mode == "values":
+                final_state = chunk
+            else:
+                for node_name in chunk:
+                    print(f"  {label}✓ {node_name}", flush=True)
         
         if not validate_research_output(final_state):
             logger.warning("Output validation failed - some fields may be missing")
@@ -49,44 +74,121 @@ def run_research(query: str) -> dict:
         raise
 
 
-def format_response_for_cli(result: dict) -> str:
+def run_research(query: str) -> dict:
+    """
+    Run the research agent workflow with the given query.
+    
+    Args:
+        query: The research question or topic
+        
+    Returns:
+        Dictionary containing the research results
+    """
+    return asyncio.run(arun_research(query))
+
+
+def format_response_for_cli(result: dict, number: int = None) -> str:
     """
     Format research results for CLI display.
     
     Args:
         result: Research results dictionary
+        number: Optional query number shown in the heading
         
     Returns:
         Formatted string for display
     """
-    from datetime import datetime
+    label = f" (question #{number})" if number is not None else ""
+    return (
+        f"\n💡 Answer{label}:\n{DASH60}\n"
+        f"{result.get('summary', 'No answer available')}\n"
+        f"\n⏰ Timestamp:\n{DASH60}\n"
+        f"{datetime.now():%Y-%m-%d %H:%M:%S}\n"
+        f"\n{BAR60}"
+    )
+
+
+async def _prompt(text: str):
+    """
+    Read one line from stdin without blocking the event loop.
     
-    lines = []
-    lines.append("\n💡 Answer:")
-    lines.append("-" * 60)
-    lines.append(result.get("summary", "No answer available"))
-    lines.append("\n⏰ Timestamp:")
-    lines.append("-" * 60)
-    lines.append(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    lines.append("\n" + "=" * 60)
+    Uses a daemon thread so a pending prompt never delays interpreter exit.
     
-    return "\n".join(lines)
+    Args:
+        text: Prompt to display
+        
+    Returns:
+        The line read, or None at end of input
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(value):
+        if not future.done():
+            future.set_result(value)
+    
+    def read():
+        try:
+            value = input(text)
+        except EOFError:
+            value = None
+        try:
+            loop.call_soon_threadsafe(deliver, value)
+        except RuntimeError:
+            pass  # Loop already closed (session ended)
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
 
 
-def interactive_mode():
-    """Run the research agent in interactive mode."""
+async def _answer(query: str, number: int, slots: asyncio.Semaphore) -> None:
+    """
+    Research one question and print the answer, labelled with its number.
+    
+    Args:
+        query: The research question
+        number: Query number shown with the answer
+        slots: Semaphore limiting concurrent research runs
+    """
+    async with slots:
+        try:
+            result = await arun_research(query, number)
+            # One print call, so concurrent answers never interleave
+            print(f"\n📨 Question #{number}: {query}\n{format_response_for_cli(result, number)}")
+            
+        except ValueError as e:
+            print(f"\n❌ Configuration Error (question #{number}): {e}")
+            print("\nPlease ensure you have:")
+            print("1. Created a .env file (copy from .env.example)")
+            print("2. Added your GROQ_API_KEY to the .env file")
+            
+        except Exception as e:
+            print(f"\n❌ Error (question #{number}): {e}")
+            logger.exception("Full error details:")
+            print("\nYou can continue with another question or type 'quit' to exit.")
+
+
+async def interactive_mode():
+    """
+    Run the research agent in interactive mode.
+    
+    Questions are researched in the background, so the next one can be typed
+    while earlier ones are still running (up to MAX_CONCURRENT_QUERIES at once).
+    """
     print_welcome()
     
     query_count = 0
+    slots = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    pending = set()
     
     try:
         while True:
             # Prompt for query
-            try:
-                query = input("\n🔍 Your Question: ").strip()
-            except EOFError:
+            query = await _prompt("\n🔍 Your Question: ")
+            if query is None:
                 print("\n\n👋 Goodbye!")
                 break
+            query = query.strip()
             
             # Handle empty input
             if not query:
@@ -101,36 +203,35 @@ def interactive_mode():
                 print_welcome()
                 continue
             
-            # Process query
+            # Process query in the background
             query_count += 1
             print(f"\n🤔 Researching... (Query #{query_count})")
             
-            try:
-                result = run_research(query)
-                print(format_response_for_cli(result))
-                
-            except ValueError as e:
-                print(f"\n❌ Configuration Error: {e}")
-                print("\nPlease ensure you have:")
-                print("1. Created a .env file (copy from .env.example)")
-                print("2. Added your GROQ_API_KEY to the .env file")
-                break
-                
-            except Exception as e:
-                print(f"\n❌ Error: {e}")
-                logger.exception("Full error details:")
-                print("\nYou can continue with another question or type 'quit' to exit.")
+            task = asyncio.create_task(_answer(query, query_count, slots))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        
+        if pending:
+            print(f"\n⏳ Waiting for {len(pending)} question(s) still in progress...")
+            await asyncio.gather(*pending)
     
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        if pending:
+            print(f"\n\n⏹ Cancelling {len(pending)} question(s) still in progress...")
+            for task in pending:
+                task.cancel()
         print("\n\n👋 Interrupted. Goodbye!")
     
     if query_count > 0:
-        print(f"\n✅ Answered {query_count} question(s) in this session.")
+        print(f"\n✅ Asked {query_count} question(s) in this session.")
 
 
 def main():
     """Main entrypoint for interactive CLI."""
-    interactive_mode()
+    try:
+        asyncio.run(interactive_mode())
+    except KeyboardInterrupt:
+        pass  # Already reported by interactive_mode
 
 
 if __name__ == "__main__":
@@ -1,11 +1,23 @@
 """Main entrypoint for the LangGraph research agent."""
 
+from config.env import load_env
+load_env()
+
 import sys
-from graphs.research_graph import research_graph
+from types import MappingProxyType
 from utils.formatting import format_research_output, validate_research_output, print_header
 from utils.logger import logger
 
 
+# Empty graph input; every query copies it and fills in the question
+_INITIAL_STATE_TEMPLATE = MappingProxyType({
+    "summary": "",
+    "key_points": [],
+    "sources_consulted": [],
+    "internal_notes": ""
+})
+
+
 def run_research(query: str) -> dict:
     """
     Run the research agent workflow with the given query.
@@ -20,20 +32,23 @@ def run_research(query: str) -> dict:
         >>> result = run_research("What are the key benefits of LangGraph?")
         >>> print(result['summary'])
     """
+    # Imported here so the prompt appears before the LLM stack is loaded
+    from graphs.research_graph import research_graph
+    
     logger.info(f"Starting research workflow for query: '{query}'")
     
     # Initialize state
-    initial_state = {
-        "query": query,
-        "summary": "",
-        "key_points": [],
-        "sources_consulted": [],
-        "internal_notes": ""
-    }
+    initial_state = {**_INITIAL_STATE_TEMPLATE, "query": query}
     
-    # Invoke the graph
+    # Stream the graph so each step is reported as soon as it finishes
     try:
-        final_state = research_graph.invoke(initial_state)
+        final_state = initial_state
+        for mode, chunk in research_graph.stream(initial_state, stream_mode=["updates", "values"]):
+            if mode == "values":
+                final_state = chunk
+            else:
+                for node_name in chunk:
+                    print(f"  ✓ {node_name}", flush=True)
         
         # Validate output
         if not validate_research_output(final_state):
@@ -9,13 +9,48 @@ Usage:
     uv run python mobility_research.py "Car-sharing service" --context "Urban area"
 """
 
+from config.env import load_env
+load_env()
+
 import sys
+import asyncio
 import argparse
 from pathlib import Path
-from graphs.mobility_graph import mobility_graph
-from utils.formatting import print_header
+from types import MappingProxyType
+from config.settings import settings
+from utils.formatting import BAR60, print_header
+from utils.json_utils import format_json_pretty
 from utils.logger import logger
-import json
+
+
+# Empty graph input; every run copies it and fills in the measure
+_INITIAL_STATE_TEMPLATE = MappingProxyType({
+    # Initialize all section fields
+    "meta": {},
+    "overview": {},
+    "context_data": {},
+    "evidence": {},
+    "impact": {},
+    "requirements": {},
+    "infrastructure": {},
+    "operations": {},
+    "costs": {},
+    "risks": {},
+    "monitoring": {},
+    "checklist": {},
+    "lifecycle": {},
+    "roles_responsibilities_detailed": {},
+    "financial_model": {},
+    "compliance": {},
+    "visibility_and_communication_design": {},
+    "selection_logic": {},
+    "future_scalability": {},
+    
+    # Output fields
+    "complete_measure": {},
+    "output_path": "",
+    "errors": []
+})
 
 
 def research_mobility_measure(measure_name: str, context: str = "") -> dict:
@@ -29,39 +64,14 @@ def research_mobility_measure(measure_name: str, context: str = "") -> dict:
     Returns:
         Final state with complete mobility measure
     """
+    # Imported here so --help and prompts don't wait on the LLM stack
+    from agents.mobility.base import token_usage
+    from config.llm import llm_admission
+    from graphs.mobility_graph import mobility_graph
+    
     logger.info(f"Starting mobility research for: '{measure_name}'")
     
-    # Initialize state
-    initial_state = {
-        "measure_name": measure_name,
-        "context": context,
-        
-        # Initialize all section fields
-        "meta": {},
-        "overview": {},
-        "context_data": {},
-        "evidence": {},
-        "impact": {},
-        "requirements": {},
-        "infrastructure": {},
-        "operations": {},
-        "costs": {},
-        "risks": {},
-        "monitoring": {},
-        "checklist": {},
-        "lifecycle": {},
-        "roles_responsibilities_detailed": {},
-        "financial_model": {},
-        "compliance": {},
-        "visibility_and_communication_design": {},
-        "selection_logic": {},
-        "future_scalability": {},
-        
-        # Output fields
-        "complete_measure": {},
-        "output_path": "",
-        "errors": []
-    }
+    initial_state = {**_INITIAL_STATE_TEMPLATE, "measure_name": measure_name, "context": context}
     
     # Invoke the multi-agent graph
     try:
@@ -69,11 +79,15 @@ def research_mobility_measure(measure_name: str, context: str = "") -> dict:
         print(f"\nMobility Measure: {measure_name}")
         if context:
             print(f"Context: {context}")
-        print("\n" + "=" * 60)
+        print("\n" + BAR60)
         print("Executing 19 specialized agents in parallel...")
-        print("=" * 60)
+        print(BAR60)
         
-        final_state = mobility_graph.invoke(initial_state)
+        # Async invocation lets LangGraph await the agent nodes concurrently
+        final_state = asyncio.run(mobility_graph.ainvoke(initial_state))
+        if settings.DEBUG:
+            logger.debug(f"LLM admission stats: {llm_admission.stats()}")
+        logger.info(f"Token usage: {token_usage()}")
         
         return final_state
         
@@ -89,17 +103,19 @@ def display_results(state: dict):
     Args:
         state: Final state from the workflow
     """
-    print("\n" + "=" * 60)
+    from agents.mobility.assembly_agent import wait_for_output
+    
+    print("\n" + BAR60)
     
     if state["errors"]:
         print("❌ ERRORS ENCOUNTERED:")
-        print("=" * 60)
+        print(BAR60)
         for error in state["errors"]:
             print(f"  • {error}")
         return
     
     print("✅ RESEARCH COMPLETE")
-    print("=" * 60)
+    print(BAR60)
     
     # Show summary
     complete = state.get("complete_measure", {})
@@ -115,7 +131,9 @@ def display_results(state: dict):
     
     # Show output file
     output_path = state.get("output_path", "")
-    if output_path:
+    if output_path and not wait_for_output(output_path):
+        print(f"\n❌ Failed to save: {output_path}")
+    elif output_path:
         print(f"\n💾 Saved to: {output_path}")
         
         # Show file size
@@ -125,7 +143,7 @@ def display_results(state: dict):
         # Count sections
         print(f"📑 Sections: 19")
     
-    print("\n" + "=" * 60)
+    print("\n" + BAR60)
 
 
 def main():
@@ -164,7 +182,7 @@ Examples:
     # Get measure name
     if not args.measure_name:
         print("Mobility Measure Research System")
-        print("=" * 60)
+        print(BAR60)
         measure_name = input("\n🔍 Enter mobility measure name: ").strip()
         
         if not measure_name:
@@ -185,10 +203,10 @@ Examples:
         
         # Optionally view JSON
         if args.view and result.get("complete_measure"):
-            print("\n" + "=" * 60)
+            print("\n" + BAR60)
             print("JSON OUTPUT:")
-            print("=" * 60)
-            print(json.dumps(result["complete_measure"], indent=2))
+            print(BAR60)
+            print(format_json_pretty(result["complete_measure"]))
         
     except ValueError as e:
         print(f"\n❌ Configuration Error: {e}")
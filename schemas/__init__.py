@@ -3,6 +3,7 @@
 from schemas.mobility_measure import (
     CompleteMobilityMeasure,
     MobilityResearchState,
+    MobilityBatchState,
     MobilityMeasureMeta,
     MobilityMeasureOverview,
     MobilityMeasureContext,
@@ -22,12 +23,14 @@ from schemas.mobility_measure import (
     MobilityMeasureVisibilityAndCommunicationDesign,
     MobilityMeasureSelectionLogic,
     MobilityMeasureFutureScalability,
+    SECTION_SCHEMAS,
 )
 
 from schemas.validators import (
     validate_section,
     validate_complete_measure,
     merge_sections,
+    merge_and_validate,
     safe_json_parse,
     clean_json_output,
     pretty_print_json,
@@ -37,6 +40,7 @@ __all__ = [
     # Complete schemas
     "CompleteMobilityMeasure",
     "MobilityResearchState",
+    "MobilityBatchState",
     
     # Section schemas
     "MobilityMeasureMeta",
@@ -58,11 +62,13 @@ __all__ = [
     "MobilityMeasureVisibilityAndCommunicationDesign",
     "MobilityMeasureSelectionLogic",
     "MobilityMeasureFutureScalability",
+    "SECTION_SCHEMAS",
     
     # Validators
     "validate_section",
     "validate_complete_measure",
     "merge_sections",
+    "merge_and_validate",
     "safe_json_parse",
     "clean_json_output",
     "pretty_print_json",
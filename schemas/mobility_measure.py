@@ -5,7 +5,7 @@ This module defines the TypedDict schemas for all sections of a mobility measure
 Each section corresponds to one specialized agent's output.
 """
 
-from typing import TypedDict, List, Literal, Annotated
+from typing import TypedDict, List, Literal, Annotated, Dict
 from datetime import datetime
 import operator
 
@@ -298,3 +298,45 @@ class MobilityResearchState(TypedDict):
     complete_measure: CompleteMobilityMeasure
     output_path: str  # Path to saved JSON file
     errors: Annotated[List[str], operator.add]  # Collect errors from all agents
+
+
+class MobilityBatchState(TypedDict):
+    """
+    State for running section agents over a catalog of measures.
+    
+    Each batch node writes one list of sections (in `measures` order) under
+    its state key in `sections`.
+    """
+    # Input: [{"measure_name": ..., "context": ...}, ...]
+    measures: List[Dict[str, str]]
+    
+    # Agent results: state key -> one section per measure
+    sections: Annotated[Dict[str, List[dict]], operator.or_]
+    errors: Annotated[List[str], operator.add]
+
+
+# ============================================================================
+# SECTION LOOKUP (agent section name -> schema)
+# ============================================================================
+
+SECTION_SCHEMAS: Dict[str, type] = {
+    "meta": MobilityMeasureMeta,
+    "overview": MobilityMeasureOverview,
+    "context": MobilityMeasureContext,
+    "evidence": MobilityMeasureEvidence,
+    "impact": MobilityMeasureImpact,
+    "requirements": MobilityMeasureRequirements,
+    "infrastructure": MobilityMeasureInfrastructure,
+    "operations": MobilityMeasureOperations,
+    "costs": MobilityMeasureCosts,
+    "risks": MobilityMeasureRisks,
+    "monitoring": MobilityMeasureMonitoring,
+    "checklist": MobilityMeasureChecklist,
+    "lifecycle": MobilityMeasureLifecycle,
+    "roles": MobilityMeasureRolesResponsibilitiesDetailed,
+    "financial": MobilityMeasureFinancialModel,
+    "compliance": MobilityMeasureCompliance,
+    "visibility": MobilityMeasureVisibilityAndCommunicationDesign,
+    "selection": MobilityMeasureSelectionLogic,
+    "scalability": MobilityMeasureFutureScalability,
+}
@@ -0,0 +1,390 @@
+"""
+Section schema prompts for the mobility agents.
+
+One entry per agent section name. Kept as module-level constants so every
+prompt exists once, independent of the agent classes that use it.
+"""
+
+from types import MappingProxyType
+from typing import Mapping
+
+
+_PROMPTS = {
+    "meta": '''Generate ONLY the "meta" section:
+
+{
+  "name": "",
+  "short_description": "",
+  "category": "",
+  "tags": [],
+  "status": "active",
+  "last_updated": "<ISO timestamp>",
+  "images": [],
+  "impact_level": 1-5,
+  "cost_level": 1-5
+}
+
+Category Definitions:
+- Active Mobility: Supports walking, cycling, e-bikes, and cargo bikes (safe infrastructure, secure parking, maintenance).
+- Shared Mobility: Services where vehicles are collectively used (shared cars, shared bikes, cargo-bike pools).
+- Public Transport: Strengthens access to buses, metro, trains, trams, or integrates housing with transit.
+- Information & Nudging: Increases awareness, visibility, behavioural support, and real-time info.
+- Logistics: Reduces private car need by simplifying tasks (delivery lockers, tool libraries, goods transport).
+
+Rules:
+- short_description = max 20–25 words.
+- tags = 3–7 lowercase keywords.
+- category must be one of: "Active Mobility", "Shared Mobility", "Public Transport", "Information & Nudging", "Logistics".
+- Do not include any other JSON keys.''',
+
+    "overview": '''Generate ONLY the "overview" section:
+
+{
+  "description": "",
+  "behavioural_primary": "",
+  "behavioural_secondary": []
+}
+
+Your content must provide meaningful explanation, not generic statements.
+Describe what the mobility measure fundamentally is, how it works, and why it matters.
+The behavioural fields must describe real behavioural dynamics, not vague goals.
+
+Rules:
+- description = 2–3 sentences providing substantive explanation of what this measure is and how it functions
+- behavioural_primary = describe the main behavioural change this measure aims to influence and why
+- behavioural_secondary = 2–4 supporting behavioural patterns, each explained clearly''',
+
+    "context": '''Generate ONLY the "context" section:
+
+{
+  "target_users": [],
+  "suitable_strong": [],
+  "suitable_weak": []
+}
+
+For each suitability item, describe conditions precisely.
+Avoid vague labels like "urban" alone.
+Focus on specific situational characteristics: density, land-use patterns, cycling culture, street design, and public transport integration.
+
+Rules:
+- target_users = specific user groups with meaningful descriptors
+- suitable_strong = describe WHERE and WHY this measure works well (8-15 words per item)
+- suitable_weak = describe conditions that limit effectiveness with reasoning (8-15 words per item)''',
+
+    "evidence": '''Generate ONLY the "evidence" section:
+
+{
+  "sweden": [],
+  "europe": [],
+  "research": [],
+  "behavioural": []
+}
+
+Provide descriptive, research-aligned insights.
+Each bullet must convey an actual finding or pattern.
+Avoid clichés like "this increases sustainability".
+Base statements on known mobility principles (secure parking improves cycling rates, proximity increases mode choice likelihood, etc.)
+
+Rules:
+- Each item should be a meaningful insight, not a generic claim
+- Reference real mobility patterns and principles
+- 1–3 substantive points per field''',
+
+    "impact": '''Generate ONLY:
+
+{
+  "car_ownership_reduction": "",
+  "modal_shift": "",
+  "parking_reduction": "",
+  "satisfaction": "",
+  "congestion_reduction": "",
+  "long_distance_support": "",
+  "other": ""
+}
+
+Describe expected impacts in meaningful qualitative ranges.
+Avoid single words like "high" unless paired with detail (e.g., "high, especially in dense districts where cycling is common").
+
+Rules:
+- Provide context and reasoning for each impact level
+- Use qualitative ranges with explanation when possible
+- Connect impacts to specific conditions or user groups''',
+
+    "requirements": '''Generate ONLY:
+
+{
+  "security": [],
+  "infrastructure": [],
+  "charging": [],
+  "accessibility": [],
+  "information": [],
+  "quality_standards": []
+}
+
+Each requirement must be descriptive and concrete.
+Avoid terms like "secure bike parking" alone.
+Instead describe what security means (locking points, CCTV, lighting, enclosure quality).
+
+Rules:
+- Explain WHAT each requirement consists of
+- Describe WHY it matters for implementation
+- Provide specific, actionable detail''',
+
+    "infrastructure": '''Generate ONLY:
+
+{
+  "key_requirements": [],
+  "power_requirements": [],
+  "weather_protection": [],
+  "placement_rules": [],
+  "notes": ""
+}
+
+For each item, describe physical characteristics, spatial standards, dimensions, environmental considerations, and user experience.
+Avoid simple nouns; provide meaningful explanation.
+
+Rules:
+- Describe WHAT the infrastructure consists of physically
+- Include relevant dimensions, materials, or technical specs when applicable
+- Explain HOW placement or design affects functionality''',
+
+    "operations": '''Generate ONLY:
+
+{
+  "developer": [],
+  "housing_association": [],
+  "mobility_provider": [],
+  "city": [],
+  "operations_phases": {
+    "installation": [],
+    "maintenance": [],
+    "data_reporting": [],
+    "upgrades": []
+  }
+}
+
+Instead of listing actors, describe their operational role in a meaningful way:
+- What the developer maintains during construction
+- What housing associations oversee day-to-day
+- What mobility providers are responsible for regarding service reliability
+
+Rules:
+- Describe WHAT each actor actually does operationally
+- Explain responsibilities with context
+- For phases, describe activities with operational or planning detail''',
+
+    "costs": '''Generate ONLY:
+
+{
+  "upfront": "",
+  "operational": "",
+  "benefits": []
+}
+
+Provide qualitative ranges AND explanation.
+Example: "Upfront cost: medium — typically involves shelter installation, structural anchoring, and durable fixtures."
+
+Rules:
+- Use qualitative levels (low/medium/high) with reasoning
+- Explain WHAT drives costs
+- Describe benefits with specific detail''',
+
+    "risks": '''Generate ONLY:
+
+{
+  "risk_1": "",
+  "risk_2": "",
+  "risk_3": ""
+}
+
+Each risk must describe WHY the risk occurs and HOW it affects implementation or adoption.
+Avoid generic phrasing.
+
+Rules:
+- Explain the risk mechanism, not just naming it
+- Describe impact on implementation or user adoption
+- Provide context on likelihood or severity
+- Maximum 3 most significant risks''',
+
+    "monitoring": '''Generate ONLY:
+
+{
+  "metrics": [],
+  "frequency": ""
+}
+
+Metrics must be measurable and meaningful.
+Describe what each metric actually captures.
+
+Rules:
+- 3–6 specific, measurable metrics
+- Explain WHAT each metric measures and WHY it matters
+- Frequency should include reasoning (e.g., "Quarterly to capture seasonal patterns")''',
+
+    "checklist": '''Generate ONLY:
+
+{
+  "before_move_in": [],
+  "at_move_in": [],
+  "after_move_in": []
+}
+
+Checklists must describe the intention behind each step.
+For example: "Assess evening visibility to ensure safe access during winter months."
+
+Rules:
+- Each item = 3–6 steps per phase
+- Describe WHAT to verify/do and WHY it matters
+- Provide actionable detail, not generic tasks
+- Include context on timing, conditions, or stakeholders involved''',
+
+    "lifecycle": '''Generate ONLY:
+
+{
+  "stage_1_land_allocation": [],
+  "stage_2_detailed_planning": [],
+  "stage_3_construction": [],
+  "stage_4_pre_occupancy": [],
+  "stage_5_operation_year_1": [],
+  "stage_6_long_term": []
+}
+
+Each lifecycle item must describe activities with operational or planning detail.
+Avoid listing 'design' or 'choose'.
+Include considerations, dependencies, or planning context.
+
+Rules:
+- 2–5 items per stage
+- Describe WHAT happens and WHY it's important at this stage
+- Include dependencies, stakeholder coordination, or critical decisions
+- Provide planning context, not just action verbs''',
+
+    "roles": '''Generate ONLY:
+
+{
+  "developer": {
+    "financial": [],
+    "technical": [],
+    "handover": []
+  },
+  "housing_association": {
+    "financial": [],
+    "operation": [],
+    "issue_resolution": []
+  },
+  "mobility_provider": {
+    "service_level": [],
+    "data": [],
+    "support": []
+  },
+  "city": {
+    "regulation": [],
+    "monitoring": []
+  }
+}
+
+Each responsibility must state what the actor actually DOES and WHY their role matters.
+Avoid simple labels like "maintenance".
+
+Rules:
+- Describe concrete responsibilities with context
+- Explain HOW each role contributes to measure success
+- Provide operational detail on what tasks involve''',
+
+    "financial": '''Generate ONLY:
+
+{
+  "cost_distribution": {
+    "developer": [],
+    "mobility_provider": [],
+    "housing_association": [],
+    "city": []
+  },
+  "estimated_costs": {
+    "installation_cost": "",
+    "annual_maintenance": "",
+    "electricity_cost": ""
+  },
+  "savings": {
+    "parking_construction_reduction": "",
+    "reduced_need_for_family_car_ownership": ""
+  },
+  "incentives": []
+}
+
+Costs and savings must include reasoning and context.
+Avoid generic terms without explanation.
+
+Rules:
+- Use qualitative/semi-quantitative values with explanation
+- Describe WHAT drives each cost component
+- Explain HOW savings materialize
+- incentives: 1–3 items with specific detail on requirements or mechanisms''',
+
+    "compliance": '''Generate ONLY:
+
+{
+  "minimum_requirements": [],
+  "documentation_required": [],
+  "approval_process": [],
+  "non_compliance_actions": []
+}
+
+Explain compliance expectations clearly.
+Documentation items should describe what they validate.
+
+Rules:
+- Describe WHAT each requirement ensures
+- Explain WHY documentation is needed
+- Detail approval steps with stakeholders involved
+- Describe consequences and remediation for non-compliance''',
+
+    "visibility": '''Generate ONLY:
+
+{
+  "signage": [],
+  "digital": [],
+  "physical_touchpoints": []
+}
+
+Describe what signage or communication elements actually convey and how they support adoption.
+
+Rules:
+- Explain WHAT information each element communicates
+- Describe WHERE and WHEN users encounter it
+- Explain HOW it supports awareness or usage''',
+
+    "selection": '''Generate ONLY:
+
+{
+  "requires": [],
+  "not_recommended_if": [],
+  "recommended_combination": []
+}
+
+Provide meaningful context for suitability decisions.
+Avoid simple yes/no phrases.
+
+Rules:
+- Describe prerequisites with reasoning
+- Explain WHY certain conditions make this unsuitable
+- Suggest combinations that enhance effectiveness with explanation''',
+
+    "scalability": '''Generate ONLY:
+
+{
+  "conditions_for_expansion": [],
+  "extensions": []
+}
+
+Explain what conditions signal demand growth or operational expansion.
+Give realistic extensions.
+
+Rules:
+- Describe indicators that would justify expansion
+- Explain HOW extensions would build on initial implementation
+- Provide context on timing, demand thresholds, or enabling factors''',
+}
+
+# Read-only view: prompts are shared by every agent instance
+PROMPTS: Mapping[str, str] = MappingProxyType(_PROMPTS)
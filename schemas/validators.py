@@ -1,8 +1,108 @@
 """JSON validation utilities for mobility measures."""
 
+import functools
 import json
-from typing import Any, Dict, List
-from schemas.mobility_measure import CompleteMobilityMeasure
+import re
+from typing import Any, Callable, Dict, List, Literal, get_args, get_origin, get_type_hints
+from schemas.mobility_measure import CompleteMobilityMeasure, SECTION_SCHEMAS
+from utils.json_utils import format_json_pretty, loads_json
+
+
+# ============================================================================
+# COMPILED SECTION VALIDATORS
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _typed_dict_fields(schema: type) -> Dict[str, Any]:
+    """Resolved field annotations of a TypedDict (each schema is introspected once)."""
+    return get_type_hints(schema)
+
+
+def _type_check(expr: str, annotation) -> tuple[str, str]:
+    """
+    Build an inline Python condition checking expr against a type annotation.
+    
+    Returns:
+        Tuple of (condition source, human-readable type description)
+    """
+    origin = get_origin(annotation)
+    
+    if annotation is str:
+        return f"isinstance({expr}, str)", "a string"
+    if annotation is int:
+        return f"(isinstance({expr}, int) and not isinstance({expr}, bool))", "an integer"
+    if origin is Literal:
+        return f"{expr} in {get_args(annotation)!r}", f"one of {list(get_args(annotation))}"
+    if origin is list:
+        item_check, item_desc = _type_check("item", get_args(annotation)[0])
+        return (
+            f"(isinstance({expr}, list) and all({item_check} for item in {expr}))",
+            f"a list of {item_desc.removeprefix('a ').removeprefix('an ')}s",
+        )
+    return f"isinstance({expr}, dict)", "an object"
+
+
+def _emit_checks(schema: type, var: str, path: str, lines: List[str], indent: str, depth: int = 0) -> None:
+    """Append straight-line checks for every field of a TypedDict schema."""
+    for key, annotation in _typed_dict_fields(schema).items():
+        field = f"{path}{key}"
+        value = f"v{depth}"
+        lines.append(f"{indent}{value} = {var}.get({key!r}, _MISSING)")
+        lines.append(f"{indent}if {value} is _MISSING:")
+        lines.append(f"{indent}    errors.append({f'missing key {field!r}'!r})")
+        
+        if hasattr(annotation, "__required_keys__"):
+            # Nested TypedDict: check it is an object, then its own fields
+            lines.append(f"{indent}elif not isinstance({value}, dict):")
+            lines.append(f"{indent}    errors.append({f'{field!r} must be an object'!r})")
+            lines.append(f"{indent}else:")
+            _emit_checks(annotation, value, f"{field}.", lines, indent + "    ", depth + 1)
+        else:
+            check, description = _type_check(value, annotation)
+            lines.append(f"{indent}elif not {check}:")
+            lines.append(f"{indent}    errors.append({f'{field!r} must be {description}'!r})")
+
+
+@functools.lru_cache(maxsize=None)
+def compile_validator(schema: type) -> Callable[[Dict[str, Any]], List[str]]:
+    """
+    Compile a TypedDict section schema into a validation function.
+    
+    The schema is walked once and turned into straight-line Python source, so
+    validating an LLM result is a handful of isinstance checks with no
+    per-call reflection.
+    
+    Args:
+        schema: TypedDict class describing the section
+        
+    Returns:
+        Function taking a section dict and returning a list of errors
+        (empty when valid); cached, so a schema is only compiled once
+    """
+    lines = [
+        "def validate(data):",
+        "    if not isinstance(data, dict):",
+        "        return ['section must be an object']",
+        "    errors = []",
+    ]
+    _emit_checks(schema, "data", "", lines, "    ")
+    lines.append("    return errors")
+    
+    namespace = {"_MISSING": object()}
+    exec("\n".join(lines), namespace)
+    return namespace["validate"]
+
+
+# Agent section name -> compiled validator (built once at import)
+SECTION_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    name: compile_validator(schema) for name, schema in SECTION_SCHEMAS.items()
+}
+
+# Document section name -> compiled validator, in document order
+DOCUMENT_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    name: compile_validator(schema) for name, schema in _typed_dict_fields(CompleteMobilityMeasure).items()
+}
+_REQUIRED_SECTIONS = frozenset(DOCUMENT_VALIDATORS)
 
 
 def validate_section(section_name: str, data: Dict[str, Any]) -> tuple[bool, List[str]]:
@@ -26,8 +126,9 @@ def validate_section(section_name: str, data: Dict[str, Any]) -> tuple[bool, Lis
         errors.append(f"Section '{section_name}' must be a dictionary")
         return False, errors
     
-    # Basic validation - check for required keys based on section
-    # (Full schema validation would use pydantic or similar)
+    validator = SECTION_VALIDATORS.get(section_name)
+    if validator:
+        errors.extend(f"Section '{section_name}': {error}" for error in validator(data))
     
     return len(errors) == 0, errors
 
@@ -42,22 +143,20 @@ def validate_complete_measure(data: Dict[str, Any]) -> tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
+    # Check all required sections exist (one set difference), then their structure
+    missing = _REQUIRED_SECTIONS - data.keys()
     errors = []
+    if missing:
+        # Reported in document order
+        errors = [f"Missing required section: {section}" for section in DOCUMENT_VALIDATORS if section in missing]
     
-    required_sections = [
-        "meta", "overview", "context", "evidence", "impact",
-        "requirements", "infrastructure", "operations", "costs",
-        "risks", "monitoring", "checklist", "lifecycle",
-        "roles", "financial", "compliance", "visibility",
-        "selection", "scalability"
-    ]
-    
-    # Check all required sections exist
-    for section in required_sections:
-        if section not in data:
-            errors.append(f"Missing required section: {section}")
-        elif not data[section]:
+    for section, validator in DOCUMENT_VALIDATORS.items():
+        if section in missing:
+            continue
+        if not data[section]:
             errors.append(f"Section '{section}' is empty")
+        else:
+            errors.extend(f"Section '{section}': {error}" for error in validator(data[section]))
     
     return len(errors) == 0, errors
 
@@ -68,23 +167,58 @@ def merge_sections(**sections: Dict[str, Any]) -> Dict[str, Any]:
     Handles cases where models might return the inner object directly
     (unwrapped) or wrapped in the section name.
     """
+    # Wrapped { "section_name": { ... } } is unwrapped; unwrapped content
+    # (common with Haiku) is kept as-is; empty or non-dict output is skipped
+    return {
+        section_name: section_data.get(section_name, section_data)
+        for section_name, section_data in sections.items()
+        if section_data and isinstance(section_data, dict)
+    }
+
+
+def merge_and_validate(sections: Dict[str, Any]) -> tuple[Dict[str, Any], List[str]]:
+    """
+    Merge section outputs into a complete document and validate it in one pass.
+    
+    Sections are unwrapped like merge_sections; empty, missing or non-dict
+    outputs get an empty placeholder so the document always lists every
+    section as an object. Present sections are checked against their
+    compiled schema validator.
+    
+    Args:
+        sections: Section name -> agent output, in document order
+        
+    Returns:
+        Tuple of (complete_measure, list_of_errors)
+    """
     complete_measure = {}
+    errors = []
     
     for section_name, section_data in sections.items():
+        if isinstance(section_data, dict) and section_name in section_data:
+            section_data = section_data[section_name]
+        
         if not section_data:
-            continue
-            
-        # Case 1: Data is wrapped correctly { "section_name": { ... } }
-        if section_name in section_data:
-            complete_measure[section_name] = section_data[section_name]
-            
-        # Case 2: Data is unwrapped { "field1": ... } - Common with Haiku
-        # Check if it looks like the inner content (has expected keys)
-        elif isinstance(section_data, dict) and len(section_data) > 0:
-            # Assume it's the inner content and wrap it
-            complete_measure[section_name] = section_data
-            
-    return complete_measure
+            errors.append(f"Section '{section_name}' is empty")
+            section_data = {}
+        elif not isinstance(section_data, dict):
+            errors.append(f"Section '{section_name}' must be a dictionary")
+            section_data = {}
+        else:
+            validator = DOCUMENT_VALIDATORS.get(section_name)
+            if validator:
+                errors.extend(f"Section '{section_name}': {error}" for error in validator(section_data))
+        
+        complete_measure[section_name] = section_data
+    
+    return complete_measure, errors
+
+
+# Decodes one JSON value from a position, ignoring whatever follows it
+_DECODER = json.JSONDecoder()
+
+# Leading ```/```json fence, content, optional closing fence
+_FENCE_RE = re.compile(r'^\s*```(?:json)?(.*?)(?:```)?\s*$', re.DOTALL)
 
 
 def clean_json_output(text: str) -> str:
@@ -99,20 +233,16 @@ def clean_json_output(text: str) -> str:
     Returns:
         Cleaned JSON string
     """
-    # Remove markdown code blocks
-    text = text.strip()
+    # Most responses have no fence at all
+    if "```" not in text:
+        return text.strip()
     
-    if text.startswith("```json"):
-        text = text[7:]  # Remove ```json
-    elif text.startswith("```"):
-        text = text[3:]  # Remove ```
-    
-    if text.endswith("```"):
-        text = text[:-3]
-    
-    text = text.strip()
+    # Remove markdown code blocks
+    match = _FENCE_RE.match(text)
+    if match:
+        return match.group(1).strip()
     
-    return text
+    return text.strip().removesuffix("```").strip()
 
 
 def safe_json_parse(text: str) -> tuple[Dict[str, Any], str]:
@@ -127,8 +257,15 @@ def safe_json_parse(text: str) -> tuple[Dict[str, Any], str]:
     """
     try:
         cleaned = clean_json_output(text)
-        parsed = json.loads(cleaned)
-        return parsed, ""
+        try:
+            return loads_json(cleaned), ""
+        except json.JSONDecodeError:
+            # Commentary before/after the JSON: decode from its first token
+            starts = [index for index in (text.find("{"), text.find("[")) if index != -1]
+            if not starts:
+                raise
+            parsed, _ = _DECODER.raw_decode(text, min(starts))
+            return parsed, ""
     except json.JSONDecodeError as e:
         return {}, f"JSON parsing error: {str(e)}"
     except Exception as e:
@@ -145,4 +282,4 @@ def pretty_print_json(data: Dict[str, Any]) -> str:
     Returns:
         Pretty-printed JSON string
     """
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return format_json_pretty(data)
@@ -0,0 +1,39 @@
+"""Tests for the assembly agent's validation and save path."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path so we can import modules
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.mobility import assembly_agent
+from utils.json_utils import loads_json
+
+
+class TestAssemblyValidation(unittest.TestCase):
+    
+    def test_malformed_section_reported_in_metadata(self):
+        """A section failing its schema reaches _metadata.validation_errors."""
+        state = {
+            "measure_name": "Bike Share",
+            "costs": {"upfront": "low", "operational": "medium", "benefits": "fewer cars"},
+        }
+        
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(assembly_agent, "_ensure_output_dir", return_value=Path(tmp)):
+            result = assembly_agent.assembly_agent_node(state)
+            self.assertTrue(assembly_agent.wait_for_output(result["output_path"], timeout=10))
+            saved = loads_json(Path(result["output_path"]).read_bytes())
+        
+        metadata = result["complete_measure"]["_metadata"]
+        self.assertFalse(metadata["is_valid"])
+        self.assertIn("Section 'costs': 'benefits' must be a list of strings", metadata["validation_errors"])
+        self.assertEqual(saved["_metadata"]["validation_errors"], list(metadata["validation_errors"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
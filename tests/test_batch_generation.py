@@ -0,0 +1,98 @@
+"""Tests for multi-measure batch generation with a stub LLM."""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path so we can import modules
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from langchain_core.messages import AIMessage
+from agents.mobility import all_agents
+from agents.mobility.all_agents import CostsAgent, make_batch_node
+from agents.mobility.base import AgentResult
+from utils.json_utils import dumps_json
+
+
+def costs(label: str) -> dict:
+    """A costs section that passes schema validation."""
+    return {"upfront": label, "operational": "medium", "benefits": ["fewer cars"]}
+
+
+class StubLLM:
+    """Returns queued response texts in order and records each call."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+    
+    def model_copy(self, update=None):
+        return self
+    
+    def invoke(self, messages):
+        self.calls += 1
+        return AIMessage(content=self.responses.pop(0))
+
+
+class TestGenerateBatch(unittest.TestCase):
+    
+    def setUp(self):
+        # Keep the completion cache out of the tests; record what would be stored
+        mock.patch("agents.mobility.base.get_cached", return_value=None).start()
+        self.store_cached = mock.patch("agents.mobility.base.store_cached").start()
+        self.addCleanup(mock.patch.stopall)
+    
+    def agent(self, *responses):
+        """CostsAgent on a stub LLM whose per-measure generate() is recorded."""
+        agent = CostsAgent(llm_instance=StubLLM(*responses))
+        agent.generate = mock.Mock(side_effect=lambda name, ctx="": AgentResult(costs(f"single {name}"), None))
+        return agent
+    
+    def test_batch_split_in_order(self):
+        """One call yields one cached section per measure, in input order."""
+        agent = self.agent(dumps_json([costs("a"), costs("b")]))
+        
+        results = agent.generate_batch([("A", ""), ("B", "")])
+        
+        self.assertEqual(results, [(costs("a"), None), (costs("b"), None)])
+        self.assertEqual(agent.llm.calls, 1)
+        agent.generate.assert_not_called()
+        self.assertEqual(self.store_cached.call_count, 2)
+    
+    def test_count_mismatch_falls_back_per_measure(self):
+        """A response with the wrong number of sections is regenerated measure by measure."""
+        agent = self.agent(dumps_json([costs("a")]))
+        
+        results = agent.generate_batch([("A", ""), ("B", "")])
+        
+        self.assertEqual([result for result, _ in results], [costs("single A"), costs("single B")])
+        self.assertEqual(agent.generate.call_count, 2)
+        self.store_cached.assert_not_called()
+    
+    def test_invalid_section_regenerated_not_cached(self):
+        """Only schema-valid batch sections are cached; invalid ones go through generate()."""
+        invalid = {**costs("b"), "benefits": "fewer cars"}
+        agent = self.agent(dumps_json([costs("a"), invalid]))
+        
+        results = agent.generate_batch([("A", ""), ("B", "")])
+        
+        self.assertEqual([result for result, _ in results], [costs("a"), costs("single B")])
+        agent.generate.assert_called_once_with("B", "")
+        self.store_cached.assert_called_once()
+        self.assertEqual(self.store_cached.call_args.args[1:], ("A", "", costs("a")))
+    
+    def test_batch_node_writes_section_list(self):
+        """The batch node returns one section per measure under the state key."""
+        agent = self.agent(dumps_json([costs("a"), costs("b")]))
+        
+        with mock.patch.dict(all_agents._AGENTS, {"costs": agent}):
+            node = make_batch_node("costs")
+            update = asyncio.run(node({"measures": [{"measure_name": "A"}, {"measure_name": "B"}]}))
+        
+        self.assertEqual(update, {"sections": {"costs": [costs("a"), costs("b")]}, "errors": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
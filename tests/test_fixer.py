@@ -9,6 +9,9 @@ from io import StringIO
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from config.env import load_env
+load_env()
+
 from agents.mobility.json_fixer import JsonFixerAgent
 
 class TestJsonFixer(unittest.TestCase):
@@ -63,6 +66,18 @@ class TestJsonFixer(unittest.TestCase):
         
         self.assertIsNone(error)
         self.assertEqual(result.get("key1"), "value1")
+    
+    def test_truncated_json_repaired_locally(self):
+        """Truncated JSON is closed locally without calling the LLM."""
+        broken_json = '```json\n{"key1": "value1", "key2": ["a", "b",'
+        
+        fixer = JsonFixerAgent()
+        fixer.llm = MagicMock()
+        result, error = fixer.fix_json(broken_json, "Expecting value")
+        
+        self.assertIsNone(error)
+        self.assertEqual(result, {"key1": "value1", "key2": ["a", "b"]})
+        fixer.llm.invoke.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+"""Tests for incremental JSON parsing of streamed LLM output."""
+
+import sys
+import unittest
+
+# Add parent directory to path so we can import modules
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.json_utils import IncrementalJsonParser
+
+
+class TestIncrementalJsonParser(unittest.TestCase):
+    
+    def test_keys_emitted_as_they_close(self):
+        """Each top-level key is emitted by the chunk that completes it."""
+        parser = IncrementalJsonParser()
+        
+        self.assertEqual(parser.feed('```json\n{"city": ["a", "b"], '), [("city", ["a", "b"])])
+        self.assertEqual(parser.feed('"developer": {"role": "x'), [])
+        self.assertEqual(parser.feed('"}}\n```'), [("developer", {"role": "x"})])
+        self.assertTrue(parser.done)
+        self.assertEqual(parser.result, {"city": ["a", "b"], "developer": {"role": "x"}})
+    
+    def test_structural_characters_inside_strings(self):
+        """Braces, commas and escaped quotes inside strings do not split members."""
+        parser = IncrementalJsonParser()
+        text = '{"a": "x, } \\" {", "b": [1, 2]}'
+        
+        completed = []
+        for char in text:
+            completed.extend(parser.feed(char))
+        
+        self.assertEqual(completed, [("a", 'x, } " {'), ("b", [1, 2])])
+        self.assertTrue(parser.done)
+    
+    def test_incomplete_stream(self):
+        """A truncated stream keeps finished keys and is not marked done."""
+        parser = IncrementalJsonParser()
+        parser.feed('{"a": 1, "b": [1, 2')
+        
+        self.assertFalse(parser.done)
+        self.assertEqual(parser.result, {"a": 1})
+    
+    def test_malformed_member_sets_failed(self):
+        """A member that cannot be decoded is skipped and flags the parse as failed."""
+        parser = IncrementalJsonParser()
+        
+        completed = parser.feed('{"a": 1, "b": tru')
+        completed += parser.feed('e-ish, "c": [2]}')
+        
+        self.assertEqual(completed, [("a", 1), ("c", [2])])
+        self.assertTrue(parser.done)
+        self.assertTrue(parser.failed)
+        self.assertNotIn("b", parser.result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for the compiled section validators."""
+
+import sys
+import unittest
+
+# Add parent directory to path so we can import modules
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from schemas.validators import SECTION_VALIDATORS, merge_and_validate, safe_json_parse, validate_complete_measure
+
+
+class TestSectionValidators(unittest.TestCase):
+    
+    def test_valid_section(self):
+        """A section matching its schema has no errors."""
+        costs = {"upfront": "low", "operational": "medium", "benefits": ["fewer cars"]}
+        self.assertEqual(SECTION_VALIDATORS["costs"](costs), [])
+    
+    def test_nested_errors_report_paths(self):
+        """Missing and mistyped nested fields are reported with dotted paths."""
+        errors = SECTION_VALIDATORS["financial"]({
+            "cost_distribution": {"developer": [], "mobility_provider": [], "housing_association": [], "city": "all"},
+            "estimated_costs": {"installation_cost": "", "annual_maintenance": "", "electricity_cost": ""},
+            "incentives": [],
+        })
+        
+        self.assertEqual(errors, [
+            "'cost_distribution.city' must be a list of strings",
+            "missing key 'savings'",
+        ])
+    
+    def test_complete_measure_checks_section_structure(self):
+        """Document validation reports missing, empty and malformed sections."""
+        is_valid, errors = validate_complete_measure({
+            "meta": {},
+            "costs": {"upfront": "low", "operational": "medium", "benefits": "fewer cars"},
+        })
+        
+        self.assertFalse(is_valid)
+        self.assertIn("Section 'meta' is empty", errors)
+        self.assertIn("Section 'costs': 'benefits' must be a list of strings", errors)
+        self.assertIn("Missing required section: future_scalability", errors)
+
+
+class TestMergeAndValidate(unittest.TestCase):
+    
+    def test_placeholders_and_unwrapping(self):
+        """Empty sections become placeholders and wrapped sections are unwrapped."""
+        measure, errors = merge_and_validate({
+            "meta": {"meta": {"name": "Bike Share"}},
+            "overview": {"description": "Shared bikes"},
+            "context": {},
+        })
+        
+        self.assertEqual(list(measure), ["meta", "overview", "context"])
+        self.assertEqual(measure["meta"], {"name": "Bike Share"})
+        self.assertEqual(measure["context"], {})
+        self.assertIn("Section 'context' is empty", errors)
+    
+    def test_section_structure_checked(self):
+        """Present sections are run through their compiled validator."""
+        costs = {"upfront": "low", "operational": "medium", "benefits": ["fewer cars"]}
+        measure, errors = merge_and_validate({
+            "costs": {**costs, "benefits": "fewer cars"},
+            "risks": {},
+        })
+        
+        self.assertEqual(errors, [
+            "Section 'costs': 'benefits' must be a list of strings",
+            "Section 'risks' is empty",
+        ])
+        self.assertEqual(merge_and_validate({"costs": costs})[1], [])
+    
+    def test_non_dict_sections_rejected(self):
+        """Lists and strings are reported and replaced with an empty object."""
+        measure, errors = merge_and_validate({"meta": ["Bike Share"], "overview": "meta"})
+        
+        self.assertEqual(measure, {"meta": {}, "overview": {}})
+        self.assertEqual(errors, [
+            "Section 'meta' must be a dictionary",
+            "Section 'overview' must be a dictionary",
+        ])
+
+
+
+class TestSafeJsonParse(unittest.TestCase):
+    
+    def test_trailing_commentary_ignored(self):
+        """JSON followed by a closing fence and commentary still parses."""
+        parsed, error = safe_json_parse('```json\n{"upfront": "low"}\n```\nHope this helps!')
+        
+        self.assertEqual(error, "")
+        self.assertEqual(parsed, {"upfront": "low"})
+    
+    def test_invalid_json_reports_error(self):
+        """Unparseable text returns an empty dict and an error message."""
+        parsed, error = safe_json_parse("no json here")
+        
+        self.assertEqual(parsed, {})
+        self.assertTrue(error.startswith("JSON parsing error"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Admission control for outbound LLM requests.
+
+Bounds how many requests are in flight and how many tokens per minute are
+sent, so a burst of concurrent agents queues locally instead of tripping
+provider 429s. Thread-based because agent calls run in worker threads.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate_per_second: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float) -> float:
+        """
+        Take tokens from the bucket, blocking until enough are available.
+
+        Args:
+            amount: Tokens to take (clamped to capacity)
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+
+                delay = (amount - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class AdmissionController:
+    """Concurrency limit plus optional tokens-per-minute budget for LLM calls."""
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: int = 0):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrency: Maximum requests in flight at once
+            tokens_per_minute: Token budget per minute (0 disables the bucket)
+        """
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._bucket = (
+            TokenBucket(tokens_per_minute / 60.0, tokens_per_minute)
+            if tokens_per_minute > 0 else None
+        )
+        self._lock = threading.Lock()
+        self._stats = {"queued": 0, "in_flight": 0, "admitted": 0, "throttled": 0}
+
+    @contextmanager
+    def admit(self, tokens: int = 0):
+        """
+        Hold an admission slot (and token budget) for the duration of a request.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        with self._lock:
+            self._stats["queued"] += 1
+
+        self._slots.acquire()
+        try:
+            waited = self._bucket.acquire(tokens) if self._bucket and tokens else 0.0
+        except BaseException:
+            self._slots.release()
+            with self._lock:
+                self._stats["queued"] -= 1
+            raise
+
+        with self._lock:
+            self._stats["queued"] -= 1
+            self._stats["in_flight"] += 1
+            self._stats["admitted"] += 1
+            if waited:
+                self._stats["throttled"] += 1
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._stats["in_flight"] -= 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of queue depth and counters.
+
+        Returns:
+            Dict with queued, in_flight, admitted and throttled counts
+        """
+        with self._lock:
+            return dict(self._stats)
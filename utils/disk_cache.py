@@ -0,0 +1,87 @@
+"""
+Persistent key/value cache backed by SQLite.
+
+Stores JSON-serializable values with a per-entry expiry so expensive results
+(LLM sections, API lookups) survive across runs without extra dependencies.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+from utils.json_utils import dumps_json, loads_json
+
+
+class DiskCache:
+    """SQLite key/value store with a fixed time-to-live per entry."""
+
+    def __init__(self, path: str, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+            ttl_seconds: Lifetime of each stored entry
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily so importing the cache costs nothing."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the stored value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value or None
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at < time.time():
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+        return loads_json(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store value under key, replacing any existing entry.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        payload = dumps_json(value)
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + self.ttl_seconds),
+            )
+            conn.commit()
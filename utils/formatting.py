@@ -1,7 +1,12 @@
 """JSON and text formatting utilities."""
 
-import json
 from typing import Any, Dict
+from utils.json_utils import format_json_pretty
+
+
+# Console rules shared by the CLI scripts
+BAR60 = "=" * 60
+DASH60 = "-" * 60
 
 
 def format_research_output(state: Dict[str, Any]) -> str:
@@ -22,7 +27,7 @@ def format_research_output(state: Dict[str, Any]) -> str:
         "time_date": datetime.now().isoformat()
     }
     
-    return json.dumps(output, indent=2, ensure_ascii=False)
+    return format_json_pretty(output)
 
 
 def validate_research_output(state: Dict[str, Any]) -> bool:
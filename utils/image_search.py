@@ -5,12 +5,29 @@ Pexels provides free high-quality stock photos and videos.
 API Documentation: https://www.pexels.com/api/documentation/
 """
 
-import requests
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 from typing import List, Dict, Any
+from config.http import get_http_client
 from config.settings import settings
+from utils.disk_cache import DiskCache
+from utils.json_utils import loads_json
 from utils.logger import logger
 
 
+# Fail fast on unreachable hosts; allow slower responses once connected
+_PEXELS_TIMEOUT = httpx.Timeout(10.0, connect=3.05)
+# Retries for connection errors and 5xx responses (0.3s, then 0.6s backoff)
+_PEXELS_RETRIES = 2
+_PEXELS_BACKOFF = 0.3
+
+# Runs the main, broader and generic queries side by side
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="pexels")
+
+
 class PexelsImageSearch:
     """Pexels API client for searching stock images."""
     
@@ -60,15 +77,26 @@ class PexelsImageSearch:
         }
         
         try:
-            response = requests.get(
-                endpoint,
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
+            for attempt in range(_PEXELS_RETRIES + 1):
+                try:
+                    # Shared pooled client: keeps the Pexels connection warm across measures
+                    response = get_http_client().get(
+                        endpoint,
+                        headers=self.headers,
+                        params=params,
+                        timeout=_PEXELS_TIMEOUT
+                    )
+                except httpx.TransportError:
+                    if attempt == _PEXELS_RETRIES:
+                        raise
+                else:
+                    if response.status_code < 500 or attempt == _PEXELS_RETRIES:
+                        break
+                
+                time.sleep(_PEXELS_BACKOFF * 2 ** attempt)
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads_json(response.content)
                 photos = data.get("photos", [])
                 
                 logger.info(f"Found {len(photos)} images for query: '{query}'")
@@ -126,23 +154,30 @@ class PexelsImageSearch:
         return urls
 
 
-# Global instance
-_pexels_client = None
-
-
+@functools.cache
 def get_pexels_client() -> PexelsImageSearch:
     """Get or create global Pexels client instance."""
-    global _pexels_client
-    if _pexels_client is None:
-        _pexels_client = PexelsImageSearch()
-    return _pexels_client
+    return PexelsImageSearch()
+
+
+@functools.cache
+def _get_image_cache() -> DiskCache:
+    """Get or create the on-disk image search cache."""
+    return DiskCache(
+        os.path.join(settings.CACHE_DIR, "images.sqlite"),
+        settings.IMAGE_CACHE_TTL_SECONDS,
+    )
 
 
 def search_mobility_images(measure_name: str, count: int = 3) -> List[str]:
     """
     Search for mobility measure images using Pexels.
     
-    This is the main function used by agents.
+    This is the main function used by agents. Results are cached per
+    (measure name, count) in memory and on disk (IMAGE_CACHE_TTL_SECONDS),
+    so regenerating a measure does not repeat the Pexels requests. Empty
+    results (failed or rate-limited searches) are not cached, so the next
+    call tries again. Use clear_image_cache() to drop the in-memory layer.
     
     Args:
         measure_name: Name of the mobility measure
@@ -151,26 +186,74 @@ def search_mobility_images(measure_name: str, count: int = 3) -> List[str]:
     Returns:
         List of image URLs
     """
+    if settings.CACHE_DISABLE:
+        return _search_mobility_images(measure_name, count)
+    
+    # "Bike  Share " and "bike share" share one cache entry
+    return list(_cached_search(" ".join(measure_name.lower().split()), count))
+
+
+# (normalized measure name, count) -> URLs; only non-empty results are kept
+_MEMORY_CACHE: Dict[tuple, tuple] = {}
+_MEMORY_CACHE_SIZE = 512
+
+
+def clear_image_cache() -> None:
+    """Forget in-memory image results (the disk cache expires on its own TTL)."""
+    _MEMORY_CACHE.clear()
+
+
+def _cached_search(measure_name: str, count: int) -> tuple:
+    """Memory- and disk-cached image search (empty results are not cached)."""
+    urls = _MEMORY_CACHE.get((measure_name, count))
+    if urls is not None:
+        return urls
+    
+    cache = _get_image_cache()
+    key = f"{count}:{measure_name}"
+    
+    urls = cache.get(key)
+    if urls is None:
+        urls = _search_mobility_images(measure_name, count)
+        if urls:
+            cache.set(key, urls)
+    
+    urls = tuple(urls)
+    if urls:
+        if len(_MEMORY_CACHE) >= _MEMORY_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _MEMORY_CACHE.pop(next(iter(_MEMORY_CACHE)), None)
+        _MEMORY_CACHE[(measure_name, count)] = urls
+    
+    return urls
+
+
+def _search_mobility_images(measure_name: str, count: int) -> List[str]:
+    """Query Pexels for measure images, broadening the query if needed."""
     client = get_pexels_client()
     
     # Clean and prepare search query
     # For Pexels, simpler queries work better
     query = measure_name.lower()
     
-    # Try main query first
-    urls = client.get_image_urls(query, count=count, size="large")
+    # All three candidate queries start together, so falling back costs
+    # max(latencies) rather than their sum. Requests already in flight cannot
+    # be cancelled: every uncached search spends three Pexels requests.
+    main, broader, generic = (
+        _SEARCH_POOL.submit(client.get_image_urls, candidate, count, "large")
+        for candidate in (query, f"{query} urban mobility", "sustainable transport")
+    )
+    urls = main.result()
     
-    # If not enough results, try with "urban mobility" addition
+    # If not enough results, top up from the broader query
     if len(urls) < count:
-        logger.info(f"Only found {len(urls)} images, trying broader query")
-        query_alt = f"{query} urban mobility"
-        urls_alt = client.get_image_urls(query_alt, count=count-len(urls), size="large")
-        urls.extend(urls_alt)
+        logger.info(f"Only found {len(urls)} images, using broader query")
+        urls.extend(broader.result()[:count - len(urls)])
     
     # Ensure we have at least some images
     if not urls:
-        logger.warning(f"No images found for '{measure_name}', trying generic 'sustainable transport'")
-        urls = client.get_image_urls("sustainable transport", count=count, size="large")
+        logger.warning(f"No images found for '{measure_name}', using generic 'sustainable transport'")
+        urls = generic.result()
     
     return urls[:count]  # Return max requested count
 
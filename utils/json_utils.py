@@ -1,7 +1,18 @@
 """JSON utilities for parsing and cleaning LLM outputs."""
 
 import json
-from typing import Any, Dict
+import re
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+try:
+    import orjson
+except ImportError:  # Declared dependency; stdlib json covers installs without it
+    orjson = None
+
+
+# First '{' through last '}' (greedy, so nested objects stay whole)
+_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
 
 
 def extract_json_from_text(text: str) -> str:
@@ -16,42 +27,99 @@ def extract_json_from_text(text: str) -> str:
     """
     text = text.strip()
     
-    # Remove markdown code blocks
-    if "```json" in text:
-        # Extract content between ```json and ```
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        if end != -1:
-            text = text[start:end].strip()
-    elif "```" in text:
-        # Extract content between ``` and ```
-        start = text.find("```") + 3
+    # Already a bare object (JSON mode, most plain responses): no scans needed
+    if text.startswith("{") and text.endswith("}"):
+        return text
+    
+    # Remove markdown code blocks: one scan for the opening fence, one for the close
+    fence = text.find("```")
+    if fence != -1:
+        start = fence + 3
+        if text.startswith("json", start):
+            start += 4
         end = text.find("```", start)
         if end != -1:
-            text = text[start:end].strip()
+            # Search inside the fence without copying it out first
+            match = _OBJECT_RE.search(text, start, end)
+            return match.group(0) if match else text[start:end].strip()
     
     # Find JSON object boundaries
-    if "{" in text and "}" in text:
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        text = text[start:end]
+    match = _OBJECT_RE.search(text)
+    if match:
+        return match.group(0)
+    
+    return text
+
+
+def extract_json_array_from_text(text: str) -> str:
+    """
+    Extract a top-level JSON array from text that might contain markdown.
+    
+    Args:
+        text: Raw text possibly containing a JSON array
+        
+    Returns:
+        Extracted JSON array string
+    """
+    text = text.strip()
+    
+    if text.startswith("[") and text.endswith("]"):
+        return text
+    
+    start = text.find("[")
+    if start != -1:
+        end = text.rfind("]")
+        if end != -1:
+            return text[start:end + 1]
+    
+    return text
+
+
+def loads_json(text: str | bytes) -> Any:
+    """
+    Decode JSON (str or UTF-8 bytes), trying orjson first when it is installed.
+    
+    Falls back to the stdlib decoder on failure, which also accepts NaN and
+    Infinity and reports the error position used in parse error messages.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
     
-    return text.strip()
+    return json.loads(text)
 
 
-def safe_json_parse(text: str) -> tuple[Dict[str, Any], str]:
+def safe_json_parse(text: str | bytes) -> tuple[Dict[str, Any], str]:
     """
     Safely parse JSON with comprehensive error handling.
     
     Args:
-        text: JSON string to parse
+        text: JSON string to parse; raw UTF-8 bytes (e.g. an HTTP body) are
+            decoded only if they need markdown or prose stripped
         
     Returns:
         Tuple of (parsed_dict or {}, error_message or "")
     """
     try:
-        cleaned = extract_json_from_text(text)
-        parsed = json.loads(cleaned)
+        # Fast path: most responses are bare JSON, so skip the fence/brace scans
+        cleaned = text.strip()
+        
+        # Empty output, refusals and plain prose cannot contain an object
+        if (b"{" if isinstance(cleaned, (bytes, bytearray)) else "{") not in cleaned:
+            return {}, "No JSON object found in response"
+        
+        try:
+            parsed = loads_json(cleaned)
+        except json.JSONDecodeError:
+            parsed = None
+        
+        if not isinstance(parsed, dict):
+            if isinstance(cleaned, (bytes, bytearray)):
+                cleaned = cleaned.decode("utf-8")
+            cleaned = extract_json_from_text(cleaned)
+            parsed = loads_json(cleaned)
         
         if not isinstance(parsed, dict):
             return {}, "Parsed JSON is not a dictionary"
@@ -88,14 +156,180 @@ def clean_json_output(text: str) -> str:
     return extract_json_from_text(text)
 
 
+def dumps_json(data: Any) -> str:
+    """
+    Encode JSON compactly (no indentation or spaces), for data that is read
+    by programs or models rather than people.
+    
+    Non-ASCII text is kept as UTF-8: escaping it as \\uXXXX would cost more
+    tokens when the JSON is sent back to an LLM.
+    
+    Args:
+        data: JSON-serializable value
+        
+    Returns:
+        Compact JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _thaw(obj: Any) -> Any:
+    """Encoder fallback for read-only mappings (e.g. the frozen complete_measure)."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Last read-only mapping formatted and its text; the mapping is kept
+# referenced so its id cannot be reused by another object
+_last_pretty: tuple[Any, str] = (None, "")
+
+
 def format_json_pretty(data: Dict[str, Any]) -> str:
     """
     Format dictionary as pretty-printed JSON.
     
+    Uses orjson when installed, otherwise the stdlib encoder. Read-only
+    mappings (the deep-frozen complete_measure) cannot change, so formatting
+    the same one again returns the previous text.
+    
     Args:
         data: Dictionary to format
         
     Returns:
         Pretty-printed JSON string
     """
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    global _last_pretty
+    
+    if data is _last_pretty[0]:
+        return _last_pretty[1]
+    
+    if orjson is not None:
+        text = orjson.dumps(
+            data, default=_thaw, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=_thaw)
+    
+    if isinstance(data, MappingProxyType):
+        _last_pretty = (data, text)
+    return text
+
+
+def write_json_file(path, data: Dict[str, Any]) -> int:
+    """
+    Write data to a file as pretty-printed UTF-8 JSON.
+    
+    Uses orjson when installed (much faster for large documents), otherwise
+    the stdlib encoder. Either way the document is encoded in memory first and
+    written with a single call, rather than json.dump's many small writes.
+    
+    Args:
+        path: Destination file path
+        data: Dictionary to write
+        
+    Returns:
+        Number of bytes written
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    with open(path, "wb") as f:
+        f.write(payload)
+    
+    return len(payload)
+
+
+class IncrementalJsonParser:
+    """
+    Incrementally parse a streamed JSON object, emitting top-level keys as they close.
+    
+    Text before the opening brace (e.g. a markdown fence) is skipped. Each
+    completed "key": value member is decoded on its own, so callers can consume
+    finished keys while later ones are still streaming. Only the text of the
+    member currently streaming is buffered. A member that fails to decode sets
+    `failed`; its key is missing from `result`, so callers should re-parse the
+    whole text.
+    """
+    
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member: list[str] = []
+        self.result: Dict[str, Any] = {}
+        self.done = False
+        self.failed = False
+    
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Consume a chunk of streamed text.
+        
+        Args:
+            chunk: Next piece of model output
+            
+        Returns:
+            List of (key, value) pairs completed by this chunk
+        """
+        completed = []
+        if self.done or not chunk:
+            return completed
+        
+        # Start of the current member's text within this chunk
+        start = 0
+        
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    start = i + 1
+                continue
+            
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    completed.extend(self._close_member(chunk[start:i]))
+                    self.done = True
+                    return completed
+            elif char == "," and self._depth == 1:
+                completed.extend(self._close_member(chunk[start:i]))
+                start = i + 1
+        
+        if self._depth > 0:
+            self._member.append(chunk[start:])
+        
+        return completed
+    
+    def _close_member(self, tail: str) -> list[tuple[str, Any]]:
+        """Decode the buffered member text plus its final piece from this chunk."""
+        self._member.append(tail)
+        member = "".join(self._member).strip()
+        self._member = []
+        if not member:
+            return []
+        
+        try:
+            parsed = loads_json("{" + member + "}")
+        except json.JSONDecodeError:
+            self.failed = True
+            return []
+        
+        self.result.update(parsed)
+        return list(parsed.items())
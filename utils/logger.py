@@ -1,8 +1,52 @@
 """Logging configuration for the application."""
 
+import functools
 import logging
 import sys
-from config.settings import settings
+import threading
+from config.settings import get_settings
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the timestamp string within the same second."""
+    
+    _cached = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        """Format record.created, calling strftime at most once per second."""
+        second = int(record.created)
+        cached_second, cached_text = self._cached
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._cached = (second, cached_text)
+        return cached_text
+
+
+def _level() -> int:
+    """Log level based on the DEBUG setting."""
+    return logging.DEBUG if get_settings().DEBUG else logging.INFO
+
+
+@functools.cache
+def _console_handler() -> logging.Handler:
+    """
+    Console handler shared by every logger, built on first use.
+    
+    Returns:
+        stdout handler formatting records as [LEVEL] timestamp - message
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(_level())
+    handler.setFormatter(_CachedTimeFormatter(
+        fmt="[%(levelname)s] %(asctime)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    ))
+    return handler
+
+
+# Loggers already configured by setup_logger, by name
+_configured: dict[str, logging.Logger] = {}
+_configure_lock = threading.Lock()
 
 
 def setup_logger(name: str = "langgraph_agent") -> logging.Logger:
@@ -15,31 +59,30 @@ def setup_logger(name: str = "langgraph_agent") -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    
-    # Set level based on DEBUG setting
-    level = logging.DEBUG if settings.DEBUG else logging.INFO
-    logger.setLevel(level)
-    
-    # Avoid duplicate handlers
-    if logger.handlers:
+    logger = _configured.get(name)
+    if logger is not None:
         return logger
     
-    # Console handler with formatting
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
-    # Format: [LEVEL] timestamp - message
-    formatter = logging.Formatter(
-        fmt="[%(levelname)s] %(asctime)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(console_handler)
-    
-    return logger
+    # Locked so concurrent first calls cannot attach the handler twice
+    with _configure_lock:
+        if name not in _configured:
+            logger = logging.getLogger(name)
+            logger.setLevel(_level())
+            
+            # Avoid duplicate handlers
+            handler = _console_handler()
+            if handler not in logger.handlers:
+                logger.addHandler(handler)
+            
+            _configured[name] = logger
+        
+        return _configured[name]
 
 
-# Default logger instance
-logger = setup_logger()
+def __getattr__(name: str):
+    """Create the default `logger` on first access rather than at import."""
+    if name == "logger":
+        global logger
+        logger = setup_logger()
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
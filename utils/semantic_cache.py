@@ -0,0 +1,113 @@
+"""
+Nearest-neighbour cache over text embeddings, backed by SQLite.
+
+Complements DiskCache: where DiskCache only hits on identical keys, this
+returns the stored value of the most similar previous request when the cosine
+similarity clears a threshold. Entries are partitioned by namespace so values
+produced under different schemas never mix.
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, List, Optional
+from utils.json_utils import dumps_json, loads_json
+
+
+class SemanticCache:
+    """SQLite store of (namespace, embedding, value) rows searched by cosine similarity."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float,
+        threshold: float,
+        embed: Callable[[str], List[float]],
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+            ttl_seconds: Lifetime of each stored entry
+            threshold: Minimum cosine similarity for a hit
+            embed: Function mapping text to an embedding vector
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self.embed = embed
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily so importing the cache costs nothing."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS vectors ("
+                "namespace TEXT NOT NULL, embedding TEXT NOT NULL, "
+                "value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS vectors_namespace ON vectors (namespace)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        """Scale a vector to unit length so a dot product is the cosine."""
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    def get(self, namespace: str, text: str) -> Optional[Any]:
+        """
+        Return the value of the nearest stored entry, if similar enough.
+
+        Args:
+            namespace: Partition to search
+            text: Request text to match
+
+        Returns:
+            Decoded value of the best match, or None
+        """
+        query = self._normalize(self.embed(text))
+
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT embedding, value FROM vectors WHERE namespace = ? AND expires_at >= ?",
+                (namespace, time.time()),
+            ).fetchall()
+
+        best_score, best_value = self.threshold, None
+        for embedding, value in rows:
+            score = sum(a * b for a, b in zip(query, loads_json(embedding)))
+            if score >= best_score:
+                best_score, best_value = score, value
+
+        return loads_json(best_value) if best_value is not None else None
+
+    def set(self, namespace: str, text: str, value: Any) -> None:
+        """
+        Store value under the embedding of text.
+
+        Args:
+            namespace: Partition to store in
+            text: Request text
+            value: JSON-serializable value
+        """
+        embedding = dumps_json(self._normalize(self.embed(text)))
+        payload = dumps_json(value)
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM vectors WHERE expires_at < ?", (time.time(),))
+            conn.execute(
+                "INSERT INTO vectors (namespace, embedding, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, embedding, payload, time.time() + self.ttl_seconds),
+            )
+            conn.commit()